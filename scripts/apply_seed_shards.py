@@ -0,0 +1,53 @@
+import argparse
+import sys
+
+from seedlib.load import DEFAULT_WORKERS, Loader
+from seedlib.shardset import STATE_NAME, apply_shards
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Apply a sharded seed (generate_culture_seed.py --format shards) to Postgres.")
+    parser.add_argument('directory', help="Shard directory holding manifest.json")
+    parser.add_argument('--database-url', required=True, metavar='URL', help="Postgres database to apply the shards to (needs psycopg 3)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, metavar='N', help="Shards applied concurrently, one connection each")
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=f"Apply every shard, including those {STATE_NAME} records as already applied (e.g. after a database reset)",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    def report(name, outcome, error):
+        if outcome == 'failed':
+            print(f"{name}: failed: {error}", file=sys.stderr)
+        elif outcome == 'blocked':
+            print(f"{name}: not attempted, a shard it depends on failed", file=sys.stderr)
+
+    with Loader(args.database_url, args.workers) as loader:
+        results = apply_shards(
+            args.directory,
+            lambda sql: loader.run_script([sql]),
+            workers=args.workers,
+            force=args.force,
+            on_done=report,
+        )
+
+    print(
+        f"Applied {len(results['applied'])} shards, skipped {len(results['skipped'])} already applied, "
+        f"{len(results['failed'])} failed, {len(results['blocked'])} not attempted."
+    )
+    if results['failed'] or results['blocked']:
+        print("Re-run the same command to retry only the shards that did not apply.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
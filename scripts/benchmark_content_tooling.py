@@ -0,0 +1,244 @@
+import argparse
+import concurrent.futures
+import datetime
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, os.pardir, 'supabase'))
+
+import generate_culture_seed  # noqa: E402
+import generate_update_sql  # noqa: E402
+from seedlib.delta import row_id  # noqa: E402
+from seedlib.model import Lesson  # noqa: E402
+from seedlib.scan import scan_questions  # noqa: E402
+from seedlib.shard import ShardPlan  # noqa: E402
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+STAGES = ('parse', 'render', 'update')
+
+CONTEXTS = (
+    "Take off shoes in many homes.",
+    "Slippers are often used indoors.",
+    "People often bow to greet.",
+    "Lines are common at trains and stores.",
+    "Quiet voices are common on trains.",
+)
+ANSWERS = (
+    "Thank you", "Goodbye", "Respect", "Talk softly", "Wait your turn",
+    "Before eating", "After eating", "To keep places clean", "Stand in line and wait",
+)
+
+# Questions are parsed and rendered in slices of this size so no stage holds a full corpus
+RENDER_SLICE = 10000
+
+
+def write_corpus(path, size, seed=7):
+    # Deterministic synthetic bank in the raw_culture_questions.txt layout
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for n in range(1, size + 1):
+            options = rng.sample(ANSWERS, 3)
+            f.write(f"- {rng.choice(CONTEXTS)} (scenario {n})\n")
+            f.write(f"  Question {n}: What is the polite choice in scenario {n}?\n")
+            for key, text in zip("ABC", options):
+                f.write(f"  {key}. {text}\n")
+            f.write(f"  Answer: {rng.choice('ABC')}\n\n")
+
+
+def _peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _slices(questions):
+    while True:
+        chunk = list(itertools.islice(questions, RENDER_SLICE))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bench_parse(path):
+    started = time.perf_counter()
+    count = 0
+    for _ in scan_questions(path):
+        count += 1
+    elapsed = time.perf_counter() - started
+    return {'questions': count, 'seconds': elapsed, 'inputBytes': os.path.getsize(path)}
+
+
+def bench_render(path):
+    # Only the SQL rendering is timed; parsing happens between timed sections.
+    # Every question is rendered, in lessons of the default size.
+    elapsed = 0.0
+    count = 0
+    emitted = 0
+    for chunk in _slices(scan_questions(path)):
+        started = time.perf_counter()
+        for shard in ShardPlan(len(chunk)).shards(chunk):
+            for fragment in generate_culture_seed.render_lesson(shard):
+                emitted += len(fragment.encode('utf-8'))
+        elapsed += time.perf_counter() - started
+        count += len(chunk)
+    return {'questions': count, 'seconds': elapsed, 'outputBytes': emitted}
+
+
+def bench_update(path):
+    # One lesson per question, mirroring the topics list of generate_update_sql.py
+    elapsed = 0.0
+    count = 0
+    emitted = 0
+    for chunk in _slices(scan_questions(path)):
+        lessons = [
+            Lesson(row_id('bench', 'level', q.number), row_id('bench', 'lesson', q.number),
+                   f"Topic {q.number}", q.context, q.context, (q,))
+            for q in chunk
+        ]
+        started = time.perf_counter()
+        for statement in generate_update_sql.render_sql(lessons):
+            emitted += len(statement.encode('utf-8'))
+        elapsed += time.perf_counter() - started
+        count += len(chunk)
+    return {'questions': count, 'seconds': elapsed, 'outputBytes': emitted}
+
+
+BENCHES = {
+    'parse': bench_parse,
+    'render': bench_render,
+    'update': bench_update,
+}
+
+
+def run_stage(stage, path):
+    # Runs in a fresh process so peak RSS belongs to this stage alone
+    result = BENCHES[stage](path)
+    seconds = max(result['seconds'], 1e-9)
+    measured_bytes = result.get('inputBytes', result.get('outputBytes', 0))
+    result.update({
+        'stage': stage,
+        'seconds': round(result['seconds'], 4),
+        'questionsPerSec': round(result['questions'] / seconds, 1),
+        'bytesPerSec': round(measured_bytes / seconds, 1),
+        'peakRssMb': _peak_rss_mb(),
+    })
+    return result
+
+
+def run_isolated(stage, path):
+    ctx = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(run_stage, stage, path).result()
+
+
+def assess(results, baseline, max_slowdown, max_rss_mb):
+    # Compare against absolute RSS limits and, optionally, a previous report
+    failures = []
+    previous = {}
+    if baseline:
+        for entry in baseline.get('results', []):
+            previous[(entry['size'], entry['stage'])] = entry
+
+    for entry in results:
+        label = f"{entry['stage']}@{entry['size']}"
+        if max_rss_mb is not None and entry['peakRssMb'] > max_rss_mb:
+            failures.append(f"{label}: peak RSS {entry['peakRssMb']}MB > {max_rss_mb}MB")
+        old = previous.get((entry['size'], entry['stage']))
+        if old and max_slowdown is not None:
+            floor = old['questionsPerSec'] * (1 - max_slowdown)
+            if entry['questionsPerSec'] < floor:
+                failures.append(
+                    f"{label}: {entry['questionsPerSec']} q/s < {floor:.1f} q/s "
+                    f"(baseline {old['questionsPerSec']} q/s, max slowdown {max_slowdown:.0%})"
+                )
+    return failures
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Python content parser and SQL emitters.")
+    parser.add_argument(
+        '--sizes',
+        type=lambda value: [int(v) for v in value.split(',')],
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated corpus sizes in questions (default: 1000,100000,1000000)",
+    )
+    parser.add_argument('--stages', type=lambda value: value.split(','), default=list(STAGES),
+                        help="Comma-separated stages to run (parse,render,update)")
+    parser.add_argument('--corpus-dir', help="Keep generated corpora here instead of a temp dir")
+    parser.add_argument('--output-dir', default=os.path.join('artifacts', 'benchmarks'), help="Report directory")
+    parser.add_argument('--baseline', help="Previous report to compare throughput against")
+    parser.add_argument('--max-slowdown', type=float, default=0.25,
+                        help="Allowed fractional q/s drop versus --baseline (default 0.25)")
+    parser.add_argument('--max-rss-mb', type=float, help="Fail if any stage peaks above this RSS")
+    parser.add_argument('--fail-on-regression', action='store_true', help="Exit non-zero when a threshold is missed")
+    args = parser.parse_args(argv)
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus_dir = args.corpus_dir or tmp_dir
+        os.makedirs(corpus_dir, exist_ok=True)
+        for size in args.sizes:
+            path = os.path.join(corpus_dir, f"bench_culture_{size}.txt")
+            if not os.path.exists(path):
+                write_corpus(path, size)
+            for stage in args.stages:
+                entry = run_isolated(stage, path)
+                entry['size'] = size
+                results.append(entry)
+                print(
+                    f"{stage:>6} @ {size:>8}: {entry['questionsPerSec']:>12,.0f} q/s "
+                    f"{entry['bytesPerSec'] / 1e6:>8.1f} MB/s  peak {entry['peakRssMb']}MB"
+                )
+
+    failures = assess(results, baseline, args.max_slowdown if baseline else None, args.max_rss_mb)
+    summary = {
+        'executedAt': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'sizes': args.sizes,
+        'thresholds': {
+            'baseline': args.baseline,
+            'maxSlowdown': args.max_slowdown if baseline else None,
+            'maxRssMb': args.max_rss_mb,
+        },
+        'results': results,
+        'assessment': {
+            'withinThresholds': not failures,
+            'failures': failures,
+        },
+    }
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H-%M-%S')
+    output_path = os.path.join(args.output_dir, f"content-benchmark-{timestamp}.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    print(f"Saved benchmark report: {output_path}")
+
+    for failure in failures:
+        print(f"Threshold missed: {failure}", file=sys.stderr)
+    if failures and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
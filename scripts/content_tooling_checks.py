@@ -0,0 +1,226 @@
+"""Assertion checks for seedlib against the repo's real content sources.
+
+Run with `python scripts/content_tooling_checks.py`; exits non-zero on the first failure.
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import tempfile
+
+from seedlib.dedupe import NearDuplicateIndex
+from seedlib.ingest import REPO_ROOT, ingest
+from seedlib.scan import scan_questions
+from seedlib.shard import ShardPlan, balance_by_topic, infer_topic
+from seedlib.shardset import ShardSetWriter, apply_shards
+from seedlib.validate import Validator
+
+CULTURE_BANK = os.path.join(REPO_ROOT, 'supabase', 'raw_culture_questions.txt')
+
+
+def load_culture_generator():
+    spec = importlib.util.spec_from_file_location('_checks_culture_seed', os.path.join(REPO_ROOT, 'supabase', 'generate_culture_seed.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def check_dedupe_flags_cross_source_copies():
+    index = NearDuplicateIndex()
+    for question in ingest(workers=1):
+        index.add(question)
+    clusters = index.report()['duplicates']
+
+    def sources_of(prompt, answer):
+        for cluster in clusters:
+            if any(q['stem'].endswith(prompt) and q['answer'] == answer for q in cluster['questions']):
+                return set(cluster['sources'])
+        return set()
+
+    # Same prompt and answer, with the context worded differently in each source
+    shoes = sources_of("What should Kai do next?", "Take off his shoes by the door")
+    assert {'raw_questions.txt', 'scripts/generate_update_sql.py'} <= shoes, shoes
+    slippers = sources_of("Why are slippers there?", "To wear inside the house")
+    assert {'raw_questions.txt', 'scripts/generate_update_sql.py'} <= slippers, slippers
+    itadakimasu = sources_of("When do people often say Itadakimasu (Ee-tah-dah-KEE-mahs)?", "Before eating")
+    assert {'raw_questions.txt', 'supabase/raw_culture_questions.txt'} <= itadakimasu, itadakimasu
+
+
+def check_balance_topics_mixes_the_culture_bank():
+    assert infer_topic("Which train goes to the station?") == 'transport'
+    assert infer_topic("Why do people bow?") == 'culture'
+
+    questions = list(scan_questions(CULTURE_BANK))
+    balanced = balance_by_topic(questions)
+    assert sorted(q.number for q in balanced) == sorted(q.number for q in questions)
+    # The first lesson gets one question of every topic the bank has
+    first_lesson = {infer_topic(q.text) for q in balanced[:20]}
+    assert len(first_lesson) > 1, first_lesson
+    assert balanced != questions
+
+
+BAD_BANK = """- ctx one
+  Question 1: Pick one?
+  A. x
+  B. y
+  C. w
+  D. z
+  Answer: B
+
+garbage line here
+another stray line
+- ctx two
+  Question 2: Pick two?
+  A. x
+  B. y
+  C. w
+  Answer: B
+"""
+
+
+def check_validator_reports_every_problem_line():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bank.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(BAD_BANK)
+        validator = Validator(max_errors=10)
+        questions = list(scan_questions(path, validator=validator))
+
+    assert [q.answer for q in questions] == ['B', 'B'], questions
+    found = [(issue.line, issue.code) for issue in validator.issues]
+    assert found == [(2, 'option-letter'), (9, 'unparsed-text'), (10, 'unparsed-text')], found
+
+
+def check_shrinking_bank_still_clears_old_levels():
+    generator = load_culture_generator()
+    questions = list(scan_questions(CULTURE_BANK))[:150]
+    plan = ShardPlan(len(questions))
+    assert plan.order_range == (10, 18) and plan.clear_range == (10, 20), (plan.order_range, plan.clear_range)
+    sql = "".join(generator.render_seed(questions, plan))
+    assert "order_index > 10 AND order_index <= 20;" in sql
+    assert ShardPlan(len(questions), order_end=25).clear_range == (10, 25)
+    # A bank past the default range clears all of its own levels
+    assert ShardPlan(300).clear_range == (10, 25)
+
+
+def write_bank(path, count, edited=None):
+    with open(path, 'w', encoding='utf-8') as f:
+        for n in range(1, count + 1):
+            prompt = "Which one is edited?" if n == edited else f"Which one is number {n}?"
+            f.write(f"- Context {n}.\n  Question {n}: {prompt}\n  A. one\n  B. two\n  C. three\n  Answer: B\n\n")
+
+
+def check_delta_manifest_waits_for_apply():
+    generator = load_culture_generator()
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = os.path.join(tmp, 'bank.txt')
+        output = os.path.join(tmp, 'delta.sql')
+        manifest = os.path.join(tmp, 'seed.manifest.json')
+        args = ['--input', bank, '--output', output, '--delta', '--manifest', manifest, '--lessons-per-level', '1']
+
+        def delta():
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator.main(args)
+            with open(output, encoding='utf-8') as f:
+                return f.read()
+
+        def mark_applied():
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator.main(args + ['--mark-applied'])
+
+        write_bank(bank, 60)
+        first = delta()
+        assert first.count("INSERT INTO public.lessons") == 3, first
+        # Generating again before the first SQL was applied must not drop the changes
+        assert delta() == first
+        assert not os.path.exists(manifest)
+
+        mark_applied()
+        unchanged = delta()
+        assert "INSERT INTO" not in unchanged and "DELETE FROM" not in unchanged, unchanged
+        mark_applied()
+
+        write_bank(bank, 40, edited=25)
+        shrunk = delta()
+        assert shrunk.count("INSERT INTO public.lessons") == 1, shrunk
+        removed_level = generator.load_manifest(manifest)['lesson-3']['level_id']
+        assert f"DELETE FROM public.levels WHERE id = '{removed_level}';" in shrunk, shrunk
+
+        try:
+            mark_applied()
+            mark_applied()
+        except SystemExit as exc:
+            assert "No pending manifest" in str(exc), exc
+        else:
+            raise AssertionError("--mark-applied twice should fail")
+
+
+def write_shard_set(directory):
+    # prepare, then level-1 and level-2 on top of it, then a lesson needing level-1
+    shard_set = ShardSetWriter(directory, 'checks')
+    shard_set.add('prepare', ["-- prepare\n"])
+    shard_set.add('level-1', ["-- level-1\n"], depends_on=['prepare'])
+    shard_set.add('level-2', ["-- level-2\n"], depends_on=['prepare'])
+    shard_set.add('lesson-1', ["-- lesson-1\n"], depends_on=['level-1'])
+    shard_set.finish()
+
+
+def check_apply_shards_retries_only_what_failed():
+    def applier(failing=()):
+        ran = []
+
+        def run(sql):
+            name = sql.split()[1]
+            ran.append(name)
+            if name in failing:
+                raise RuntimeError(f"{name} broke")
+        return ran, run
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_shard_set(tmp)
+        ran, run = applier(failing={'level-2'})
+        results = apply_shards(tmp, run, workers=2)
+        assert results['failed'] == {'level-2': "level-2 broke"}, results
+        assert sorted(results['applied']) == ['lesson-1', 'level-1', 'prepare'], results
+        # The rerun applies the failed shard and nothing else
+        ran, run = applier()
+        results = apply_shards(tmp, run, workers=2)
+        assert ran == ['level-2'] and results['applied'] == ['level-2'], (ran, results)
+        assert sorted(results['skipped']) == ['lesson-1', 'level-1', 'prepare'], results
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_shard_set(tmp)
+        ran, run = applier(failing={'prepare'})
+        results = apply_shards(tmp, run, workers=2)
+        assert ran == ['prepare'], ran
+        assert sorted(results['blocked']) == ['lesson-1', 'level-1', 'level-2'], results
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_shard_set(tmp)
+        with open(os.path.join(tmp, 'level-1.sql'), 'a', encoding='utf-8') as f:
+            f.write("DELETE FROM public.levels;\n")
+        ran, run = applier()
+        results = apply_shards(tmp, run, workers=2)
+        assert 'level-1' not in ran and 'checksum' in results['failed']['level-1'], (ran, results)
+        assert results['blocked'] == ['lesson-1'], results
+
+
+CHECKS = (
+    check_dedupe_flags_cross_source_copies,
+    check_balance_topics_mixes_the_culture_bank,
+    check_validator_reports_every_problem_line,
+    check_shrinking_bank_still_clears_old_levels,
+    check_delta_manifest_waits_for_apply,
+    check_apply_shards_retries_only_what_failed,
+)
+
+
+def main():
+    for check in CHECKS:
+        check()
+        print(f"ok {check.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import argparse
+
+from seedlib.bundle import DEFAULT_OUTPUT_DIR, FACT_SOURCES, export_bundles
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Split the supercharge facts into per-topic, per-difficulty bundles.")
+    parser.add_argument(
+        '--source',
+        action='append',
+        dest='sources',
+        metavar='PATH',
+        help=f"Fact file relative to the repo root; repeat for several, first id wins (default: {', '.join(FACT_SOURCES)})",
+    )
+    parser.add_argument('--output-dir', help=f"Bundle directory (default: {DEFAULT_OUTPUT_DIR} in the repo)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    index, skipped, removed = export_bundles(args.sources, args.output_dir)
+
+    for topic, difficulties in index['shards'].items():
+        for difficulty, shard in difficulties.items():
+            print(f"{topic}/{difficulty}: {shard['count']} facts, {shard['bytes']} bytes -> {shard['file']}")
+    print(f"Exported {index['count']} facts into {sum(len(d) for d in index['shards'].values())} bundles.")
+    if any(skipped.values()):
+        print(
+            f"Skipped {skipped['duplicate']} facts with an id already exported, {skipped['invalid']} invalid facts "
+            f"and {skipped['blocked']} with blocked terms."
+        )
+    if removed:
+        print(f"Removed {len(removed)} outdated bundles.")
+
+
+if __name__ == "__main__":
+    main()
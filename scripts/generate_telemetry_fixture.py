@@ -0,0 +1,101 @@
+import argparse
+import datetime
+
+from seedlib.fixtures import (
+    DEFAULT_ACTIVE_RATE,
+    DEFAULT_CHILDREN_PER_FAMILY,
+    DEFAULT_DAYS,
+    DEFAULT_END_DATE,
+    DEFAULT_FAMILIES,
+    DEFAULT_LESSONS,
+    DEFAULT_SEED,
+    DEFAULT_SESSIONS_PER_DAY,
+    FixturePlan,
+    family_id,
+    parent_id,
+    render_fixture,
+)
+from seedlib.stats import NULL_STATS, Stats
+from seedlib.writer import write_sql
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate a deterministic quest telemetry fixture (psql COPY script) for benchmarking the rollup RPCs."
+    )
+    parser.add_argument('--output', default='telemetry_fixture.sql', help="psql script to write (.sql.gz is gzip-compressed)")
+    parser.add_argument('--families', type=int, default=DEFAULT_FAMILIES, metavar='N', help="Families to create")
+    parser.add_argument('--children-per-family', type=int, default=DEFAULT_CHILDREN_PER_FAMILY, metavar='N', help="Children in each family")
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS, metavar='N', help="Days of activity, ending on --end-date")
+    parser.add_argument(
+        '--end-date',
+        type=datetime.date.fromisoformat,
+        default=DEFAULT_END_DATE,
+        metavar='YYYY-MM-DD',
+        help=f"Last day with activity (default {DEFAULT_END_DATE.isoformat()})",
+    )
+    parser.add_argument('--active-rate', type=float, default=DEFAULT_ACTIVE_RATE, metavar='R', help="Share of days an average child plays")
+    parser.add_argument(
+        '--sessions-per-day',
+        type=float,
+        default=DEFAULT_SESSIONS_PER_DAY,
+        metavar='N',
+        help="Average quest sessions on a day a child plays",
+    )
+    parser.add_argument(
+        '--lessons',
+        type=int,
+        default=DEFAULT_LESSONS,
+        metavar='N',
+        help="Culture seed lessons the children complete (0 skips lesson_completions)",
+    )
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Random seed; the same options always give the same file")
+    parser.add_argument(
+        '--stats',
+        nargs='?',
+        const='-',
+        metavar='PATH',
+        help="Write a JSON summary of stage timings and counters to PATH (stderr if omitted)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        args.plan = FixturePlan(
+            args.families,
+            args.children_per_family,
+            args.days,
+            args.end_date,
+            args.active_rate,
+            args.sessions_per_day,
+            args.lessons,
+            args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    plan = args.plan
+    stats = Stats() if args.stats else NULL_STATS
+    counts = {}
+    writer = write_sql(args.output, render_fixture(plan, counts), stats)
+
+    print(f"Generated telemetry fixture for {plan.families} families, {plan.children} children -> {args.output}")
+    print(f"Activity: {plan.start_date.isoformat()} to {plan.end_date.isoformat()} ({plan.days} days).")
+    for table, rows in counts.items():
+        print(f"{table}: {rows} rows")
+    print(f"Benchmark family: {family_id(1)} (parent profile {parent_id(1)})")
+    if stats.enabled:
+        stats.report(
+            args.stats,
+            output=args.output,
+            families=plan.families,
+            children=plan.children,
+            rows=counts,
+            bytesEmitted=writer.bytes_written,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,23 @@
 
-import json
+import argparse
+
+from seedlib.delta import content_hash, is_unchanged, load_manifest, promote_manifest, removed_keys, row_id, save_manifest, save_pending_manifest
+from seedlib.encode import options_encoder
+from seedlib.load import Loader
+from seedlib.model import Lesson, Question, make_option
+from seedlib.sql import (
+    COPY_END,
+    chunked,
+    copy_header,
+    copy_row,
+    escape_sql_string,
+    insert_statement,
+    update_from_values,
+    upsert_statement,
+    uuid_array,
+)
+from seedlib.stats import NULL_STATS, Stats
+from seedlib.writer import write_sql
 
 topics = [
     {
@@ -270,27 +288,245 @@ lesson_ids = [
     "72a6d1c4-abb2-4f8e-b465-3abbadfd682e"
 ]
 
-sql = "BEGIN;\n"
-
-# Renaming levels
-for i, topic in enumerate(topics):
-    lid = level_ids[i]
-    sql += f"UPDATE public.levels SET title = '{topic['title']}', description = '{topic['description']}' WHERE id = '{lid}';\n"
-
-# Renaming lessons and clearing activities
-for i, topic in enumerate(topics):
-    lesson_id = lesson_ids[i]
-    sql += f"UPDATE public.lessons SET title = '{topic['title']}' WHERE id = '{lesson_id}';\n"
-    sql += f"DELETE FROM public.activities WHERE lesson_id = '{lesson_id}';\n"
-    
-    # Insert teaching info
-    sql += f"INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('{lesson_id}', 'info', '{topic['title']}', '{topic['intro']}', 1);\n"
-    
-    # Insert question
-    opts = json.dumps(topic['options'])
-    sql += f"INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('{lesson_id}', 'multiple_choice', '{topic['question']}', '{opts}'::jsonb, 2);\n"
-
-sql += "COMMIT;"
-
-with open('update_japan_lang.sql', 'w', encoding='utf-8') as f:
-    f.write(sql)
+ACTIVITY_COLUMNS = ('id', 'lesson_id', 'type', 'question_text', 'content', 'options', 'order_index')
+
+# Rows per VALUES list / INSERT statement, so huge batches stay within sane statement sizes
+DEFAULT_BATCH_SIZE = 1000
+
+
+def load_lessons():
+    # Pair each topic with the existing level/lesson it renames
+    lessons = []
+    for topic, level_id, lesson_id in zip(topics, level_ids, lesson_ids):
+        question = Question(
+            prompt=topic['question'],
+            options=tuple(make_option(opt['id'], opt['text']) for opt in topic['options']),
+            answer=next((opt['id'] for opt in topic['options'] if opt['is_correct']), ""),
+        )
+        lessons.append(Lesson(level_id, lesson_id, topic['title'], topic['description'], topic['intro'], (question,)))
+    return lessons
+
+
+def build_lesson(lesson, stats=NULL_STATS):
+    lesson_id = lesson.lesson_id
+    activities = [(row_id('japan-lang', lesson_id, 1), lesson_id, 'info', lesson.title, lesson.intro, None, 1)]
+    for q_idx, question in enumerate(lesson.questions):
+        order = q_idx + 2
+        with stats.stage('encode'):
+            options = options_encoder.json(question)
+        activities.append((
+            row_id('japan-lang', lesson_id, order), lesson_id, 'multiple_choice', question.prompt, None, options, order,
+        ))
+    return {
+        'lesson': lesson,
+        'level_id': lesson.level_id,
+        'lesson_id': lesson_id,
+        'activities': activities,
+        'hash': content_hash([lesson.level_id, lesson_id, lesson.title, lesson.description, activities]),
+    }
+
+
+def build_lessons(lessons, stats=NULL_STATS):
+    return [build_lesson(lesson, stats) for lesson in lessons]
+
+
+def activity_literals(activity):
+    activity_id, lesson_id, kind, text, content, options, order = activity
+    return [
+        f"'{activity_id}'",
+        f"'{lesson_id}'",
+        escape_sql_string(kind),
+        escape_sql_string(text),
+        escape_sql_string(content),
+        escape_sql_string(options) + '::jsonb' if options is not None else 'NULL',
+        str(order),
+    ]
+
+
+def render_renames(built_topics, batch_size):
+    # Renaming levels and lessons: one UPDATE ... FROM (VALUES ...) per table and batch
+    for batch in chunked(built_topics, batch_size):
+        yield update_from_values('public.levels', ('title', 'description'), [
+            [f"'{b['level_id']}'", escape_sql_string(b['lesson'].title), escape_sql_string(b['lesson'].description)]
+            for b in batch
+        ])
+    for batch in chunked(built_topics, batch_size):
+        yield update_from_values('public.lessons', ('title',), [
+            [f"'{b['lesson_id']}'", escape_sql_string(b['lesson'].title)]
+            for b in batch
+        ])
+
+
+def render_sql(lessons, batch_size=DEFAULT_BATCH_SIZE, stats=NULL_STATS):
+    # Set-based rebuild: rename every level/lesson, clear their activities and
+    # insert the new ones, in a handful of statements regardless of topic count
+    built_topics = build_lessons(lessons, stats)
+    yield "BEGIN;\n"
+    yield from render_renames(built_topics, batch_size)
+
+    for batch in chunked(built_topics, batch_size):
+        yield f"DELETE FROM public.activities WHERE lesson_id = ANY({uuid_array(b['lesson_id'] for b in batch)});\n"
+
+    activities = (activity for b in built_topics for activity in b['activities'])
+    for batch in chunked(activities, batch_size):
+        yield insert_statement('public.activities', ACTIVITY_COLUMNS, [activity_literals(a) for a in batch])
+
+    yield "COMMIT;"
+
+
+def render_copy(lessons, batch_size=DEFAULT_BATCH_SIZE, stats=NULL_STATS):
+    # Same changes as render_sql, but the activities are loaded with a single
+    # COPY ... FROM STDIN section keyed on the existing lesson ids.
+    built_topics = build_lessons(lessons, stats)
+    yield "BEGIN;\n"
+    yield from render_renames(built_topics, batch_size)
+
+    for batch in chunked(built_topics, batch_size):
+        yield f"DELETE FROM public.activities WHERE lesson_id = ANY({uuid_array(b['lesson_id'] for b in batch)});\n"
+
+    yield copy_header('public.activities', ACTIVITY_COLUMNS)
+    for b in built_topics:
+        for activity in b['activities']:
+            yield copy_row(*activity)
+    yield COPY_END
+
+    yield "COMMIT;"
+
+
+def render_delta(lessons, previous, manifest, batch_size=DEFAULT_BATCH_SIZE, stats=NULL_STATS):
+    # Only touch lessons whose topic content changed since the last manifest.
+    # Levels and lessons already exist (fixed ids above), so they are updated in
+    # place; activities get deterministic ids and are upserted.
+    changed = []
+    for built in build_lessons(lessons, stats):
+        key = built['lesson_id']
+        manifest[key] = {'hash': built['hash'], 'activity_ids': [a[0] for a in built['activities']]}
+        if not is_unchanged(previous, key, manifest[key]):
+            changed.append(built)
+
+    yield "BEGIN;\n"
+    yield from render_renames(changed, batch_size)
+
+    for batch in chunked(changed, batch_size):
+        keep_ids = [a[0] for b in batch for a in b['activities']]
+        yield (
+            f"DELETE FROM public.activities WHERE lesson_id = ANY({uuid_array(b['lesson_id'] for b in batch)})"
+            f" AND id <> ALL({uuid_array(keep_ids)});\n"
+        )
+
+    activities = (activity for b in changed for activity in b['activities'])
+    for batch in chunked(activities, batch_size):
+        yield upsert_statement('public.activities', ACTIVITY_COLUMNS, [activity_literals(a) for a in batch])
+
+    # Topics no longer generated: drop the activities this script created for them
+    removed_ids = [activity_id for key in removed_keys(previous, manifest) for activity_id in previous[key]['activity_ids']]
+    for batch in chunked(removed_ids, batch_size):
+        yield f"DELETE FROM public.activities WHERE id = ANY({uuid_array(batch)});\n"
+
+    yield "COMMIT;"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the Japan language lesson update SQL.")
+    parser.add_argument('--output', default='update_japan_lang.sql', help="SQL file to write (.sql.gz is gzip-compressed)")
+    parser.add_argument(
+        '--format',
+        choices=('sql', 'copy'),
+        default='sql',
+        help="sql: set-based UPDATE/DELETE/INSERT statements; copy: psql script loading activities with COPY ... FROM STDIN",
+    )
+    parser.add_argument(
+        '--delta',
+        action='store_true',
+        help="Only write changes for lessons whose content hash differs from --manifest",
+    )
+    parser.add_argument(
+        '--manifest',
+        default='update_japan_lang.manifest.json',
+        help="Per-lesson content hash manifest of what was last applied, read by --delta",
+    )
+    parser.add_argument(
+        '--mark-applied',
+        action='store_true',
+        help="Record the pending manifest of the last --delta run as applied, once its SQL has run, and exit",
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        metavar='N',
+        help="Maximum rows per set-based statement",
+    )
+    parser.add_argument(
+        '--database-url',
+        metavar='URL',
+        help="Run the statements against this Postgres database instead of writing --output (needs psycopg 3)",
+    )
+    parser.add_argument(
+        '--stats',
+        nargs='?',
+        const='-',
+        metavar='PATH',
+        help="Write per-stage timings and statement counts as JSON to PATH (stderr if omitted)",
+    )
+    args = parser.parse_args(argv)
+    if args.delta and args.format != 'sql':
+        parser.error("--delta only supports --format sql")
+    if args.database_url and args.format != 'sql':
+        parser.error("--database-url only supports --format sql")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be >= 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.mark_applied:
+        try:
+            promote_manifest(args.manifest)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        print(f"Recorded {args.manifest} as applied.")
+        return
+    stats = Stats() if args.stats else NULL_STATS
+    with stats.stage('parse'):
+        lessons = load_lessons()
+    manifest = None
+    if args.delta:
+        previous = load_manifest(args.manifest)
+        manifest = {}
+        statements = render_delta(lessons, previous, manifest, args.batch_size, stats)
+    elif args.format == 'copy':
+        statements = render_copy(lessons, args.batch_size, stats)
+    else:
+        statements = render_sql(lessons, args.batch_size, stats)
+
+    writer = None
+    if args.database_url:
+        # The statements are few and set-based, so they run on a single connection
+        with Loader(args.database_url, workers=1) as loader:
+            loader.run_script(stats.timed('render', statements))
+    else:
+        writer = write_sql(args.output, statements, stats)
+
+    if manifest is not None:
+        if args.database_url:
+            # The statements have run, so this is what the database holds now
+            save_manifest(args.manifest, 'generate_update_sql', manifest)
+        else:
+            pending = save_pending_manifest(args.manifest, 'generate_update_sql', manifest)
+            print(f"Apply {args.output}, then run with --mark-applied to record {pending} as applied.")
+    if stats.enabled:
+        stats.report(
+            args.stats,
+            output='database' if args.database_url else args.output,
+            format='delta' if args.delta else args.format,
+            lessons=len(lessons),
+            bytesEmitted=writer.bytes_written if writer else 0,
+            charsEmitted=writer.chars if writer else 0,
+            optionsCache=options_encoder.summary(),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import collections
+import json
+import os
+import time
+
+from seedlib.dedupe import NearDuplicateIndex
+from seedlib.ingest import DEFAULT_CHUNK_BYTES, ingest
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Read every content source into one JSON Lines question file.")
+    parser.add_argument('--output', default='content_ingest.jsonl', help="JSON Lines file to write")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        '--chunk-bytes',
+        type=int,
+        default=DEFAULT_CHUNK_BYTES,
+        help="Split text sources larger than this into separate work units",
+    )
+    parser.add_argument('--dedupe-report', metavar='PATH', help="Also write a JSON report of near-duplicate questions to PATH")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.chunk_bytes < 1:
+        parser.error("--chunk-bytes must be >= 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    started = time.perf_counter()
+    per_source = collections.Counter()
+    dedupe = NearDuplicateIndex() if args.dedupe_report else None
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        questions = ingest(workers=args.workers, chunk_bytes=args.chunk_bytes)
+        for question in dedupe.watch(questions) if dedupe is not None else questions:
+            per_source[question.source] += 1
+            f.write(json.dumps(question.to_dict(), ensure_ascii=False))
+            f.write('\n')
+
+    elapsed = time.perf_counter() - started
+    for source, count in per_source.items():
+        print(f"{source}: {count} questions")
+    print(f"Ingested {sum(per_source.values())} questions in {elapsed:.2f}s with {args.workers} workers.")
+    if dedupe is not None:
+        report = dedupe.write_report(args.dedupe_report)
+        print(f"Near-duplicates: {report['duplicateQuestions']} questions in {report['clusters']} clusters -> {args.dedupe_report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Per-topic, per-difficulty fact bundles with a hashed index for the web client."""
+
+import hashlib
+import json
+import os
+import re
+
+from .ingest import REPO_ROOT
+from .writer import write_atomic
+
+# Same order the client fetches them in (src/lib/supercharge/generator.ts);
+# the first fact with a given id wins
+FACT_SOURCES = (
+    'public/data/supercharge_facts.review.json',
+    'public/data/supercharge_facts.v1.json',
+    'public/data/supercharge_facts.json',
+)
+DEFAULT_OUTPUT_DIR = 'public/data/facts'
+INDEX_NAME = 'index.json'
+INDEX_VERSION = 1
+
+TOPICS = ('food', 'transport', 'shrines', 'school', 'phrases', 'culture', 'nature', 'general')
+DIFFICULTIES = ('Rookie', 'Scout', 'Explorer')
+REQUIRED_STRINGS = ('id', 'story', 'question', 'correctAnswer', 'explanation')
+# Substrings (of the lowercased text fields below) that make the client drop a fact
+BLOCKED_TERMS = ('gamble', 'bet', 'weapon', 'violence', 'shame')
+BLOCKED_FIELDS = ('story', 'question', 'correctAnswer', 'explanation')
+
+# Hex digits of the content hash kept in shard file names
+NAME_HASH_LENGTH = 12
+SHARD_NAME_RE = re.compile(r"^[a-z]+\.[a-z]+\.[0-9a-f]{%d}\.json$" % NAME_HASH_LENGTH)
+
+
+def minify(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def is_valid_fact(fact):
+    # The checks the client applies before using a fact; anything else it would drop anyway
+    return (
+        isinstance(fact, dict)
+        and all(isinstance(fact.get(key), str) for key in REQUIRED_STRINGS)
+        and fact.get('topic') in TOPICS
+        and fact.get('difficulty') in DIFFICULTIES
+        and isinstance(fact.get('distractors'), list)
+    )
+
+
+def is_blocked(fact):
+    # Plain substring match, as the client does ("alphabet" contains "bet")
+    text = " ".join(fact[key] for key in BLOCKED_FIELDS).lower()
+    return any(term in text for term in BLOCKED_TERMS)
+
+
+def collect_facts(paths):
+    # Returns (facts in source order, {'invalid': n, 'blocked': n, 'duplicate': n}
+    # skipped rows). Like the client, rows are filtered before the first fact
+    # with an id wins, so a blocked row does not shadow a later one.
+    facts = {}
+    skipped = {'invalid': 0, 'blocked': 0, 'duplicate': 0}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            rows = json.load(f)
+        for row in rows:
+            if not is_valid_fact(row):
+                skipped['invalid'] += 1
+            elif is_blocked(row):
+                skipped['blocked'] += 1
+            elif row['id'] in facts:
+                skipped['duplicate'] += 1
+            else:
+                facts[row['id']] = row
+    return list(facts.values()), skipped
+
+
+def build_bundles(facts):
+    # {(topic, difficulty): [fact, ...]}, in topic/difficulty order, facts in source order
+    groups = {}
+    for fact in facts:
+        groups.setdefault((fact['topic'], fact['difficulty']), []).append(fact)
+    return {key: groups[key] for key in sorted(groups, key=lambda k: (TOPICS.index(k[0]), DIFFICULTIES.index(k[1])))}
+
+
+def write_bundles(bundles, output_dir):
+    # Shards are written before the index that points at them, and shards the
+    # new index no longer lists are removed last, so a client reading the
+    # directory mid-export never follows a dangling file name.
+    os.makedirs(output_dir, exist_ok=True)
+    index = {'version': INDEX_VERSION, 'count': 0, 'shards': {}}
+    written = set()
+    for (topic, difficulty), facts in bundles.items():
+        data = minify(facts)
+        digest = hashlib.sha256(data).hexdigest()
+        name = f"{topic}.{difficulty.lower()}.{digest[:NAME_HASH_LENGTH]}.json"
+        if not os.path.exists(os.path.join(output_dir, name)):
+            write_atomic(os.path.join(output_dir, name), data)
+        written.add(name)
+        index['count'] += len(facts)
+        index['shards'].setdefault(topic, {})[difficulty] = {
+            'file': name,
+            'sha256': digest,
+            'count': len(facts),
+            'bytes': len(data),
+        }
+
+    write_atomic(os.path.join(output_dir, INDEX_NAME), minify(index))
+
+    removed = []
+    for name in sorted(os.listdir(output_dir)):
+        if SHARD_NAME_RE.match(name) and name not in written:
+            os.remove(os.path.join(output_dir, name))
+            removed.append(name)
+    return index, removed
+
+
+def export_bundles(sources=None, output_dir=None, root=REPO_ROOT):
+    paths = [os.path.join(root, path) for path in (sources or FACT_SOURCES)]
+    facts, skipped = collect_facts(paths)
+    index, removed = write_bundles(build_bundles(facts), output_dir or os.path.join(root, DEFAULT_OUTPUT_DIR))
+    return index, skipped, removed
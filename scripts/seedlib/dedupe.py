@@ -0,0 +1,201 @@
+"""Near-duplicate question index (MinHash + LSH) across content sources."""
+
+import array
+import json
+import operator
+import random
+import re
+import sys
+import zlib
+
+# Mirrors normalizeContentText in src/lib/supercharge/contentUtils.ts
+SPACE_RE = re.compile(r"\s+")
+NON_TEXT_RE = re.compile(r"[^a-z0-9\s]")
+
+SIGNATURE_SIZE = 32
+BANDS = 8  # SIGNATURE_SIZE / BANDS rows per band; candidates start showing up around 0.6 similarity
+DEFAULT_THRESHOLD = 0.75
+# Questions remembered per LSH bucket; later arrivals are compared with each
+BUCKET_SIZE = 4
+
+# (a * h + b) mod 2**32 with odd a, one pair per slot. A fixed seed keeps the
+# signatures, and therefore the report, the same on every run.
+_MASK32 = 0xFFFFFFFF
+_rng = random.Random(20260214)
+_HASHERS = tuple((_rng.getrandbits(32) | 1, _rng.getrandbits(32)) for _ in range(SIGNATURE_SIZE))
+# The same pairs packed into one 64-bit lane per slot, so one big-int
+# multiply-add hashes a shingle for every slot at once. a * h + b stays below
+# 2**64 for 32-bit a, b and h, so lanes never carry into each other.
+_LANE = 64
+_PACKED_A = sum(a << (_LANE * slot) for slot, (a, _) in enumerate(_HASHERS))
+_PACKED_B = sum(b << (_LANE * slot) for slot, (_, b) in enumerate(_HASHERS))
+_PACKED_MASK = sum(_MASK32 << (_LANE * slot) for slot in range(SIGNATURE_SIZE))
+_PACKED_ONES = sum(1 << (_LANE * slot) for slot in range(SIGNATURE_SIZE))
+_PACKED_BYTES = SIGNATURE_SIZE * _LANE // 8
+
+
+def normalize_text(value):
+    return NON_TEXT_RE.sub("", SPACE_RE.sub(" ", (value or "").lower())).strip()
+
+
+def shingles(text, prefix=""):
+    # Word bigrams (a lone word for one-word texts), hashed with crc32 so they
+    # do not depend on the per-process str hash seed. `prefix` keeps the
+    # shingles of different fields apart.
+    words = normalize_text(text).split()
+    if len(words) < 2:
+        return {zlib.crc32(f"{prefix}{word}".encode()) for word in words}
+    return {zlib.crc32(f"{prefix}{a} {b}".encode()) for a, b in zip(words, words[1:])}
+
+
+def correct_answer(question):
+    return next((opt.text for opt in question.options if opt.id == question.answer), "")
+
+
+def question_key(question, correct):
+    # What is compared: the prompt and its correct answer. Sources word the
+    # context (story, intro) of the same question very differently, so it is
+    # left out.
+    return f"{normalize_text(question.prompt)}\n{normalize_text(correct)}"
+
+
+def question_shingles(question, correct):
+    return shingles(question.prompt) | shingles(correct, "=")
+
+
+def signature(hashes):
+    # One MinHash per slot; the multiply-add hash stands in for a permutation
+    # (a plain XOR mask is cheaper but badly over- or under-estimates short stems).
+    # Every slot is kept packed: best + 2**32 - value sets bit 32 of a lane
+    # where best >= value, which becomes a mask picking value in those lanes.
+    hashes = iter(hashes)
+    best = (_PACKED_A * next(hashes) + _PACKED_B) & _PACKED_MASK
+    for h in hashes:
+        value = (_PACKED_A * h + _PACKED_B) & _PACKED_MASK
+        take = (((best + (_PACKED_ONES << 32) - value) >> 32) & _PACKED_ONES) * _MASK32
+        best ^= (best ^ value) & take
+    return array.array('I', array.array('Q', best.to_bytes(_PACKED_BYTES, sys.byteorder)))
+
+
+def similarity(a, b):
+    # Share of equal MinHash slots, an estimate of the Jaccard similarity
+    return sum(map(operator.eq, a, b)) / SIGNATURE_SIZE
+
+
+class NearDuplicateIndex:
+    # Each LSH band bucket remembers the first BUCKET_SIZE questions that
+    # landed in it; later questions are compared with those and nothing else,
+    # so adding N questions costs O(N * BANDS * BUCKET_SIZE) rather than
+    # O(N^2). Matches are merged with union-find into clusters.
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.refs = []
+        self.stems = []
+        self.answers = []
+        self._signatures = []
+        self._parent = []
+        self._buckets = {}
+        self._exact = {}
+        self.candidates = 0
+
+    def __len__(self):
+        return len(self.refs)
+
+    def _find(self, idx):
+        parent = self._parent
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    def add(self, question):
+        # The report shows stems (context + prompt, as stored in
+        # activities.question_text); matching uses question_key
+        idx = len(self.refs)
+        correct = correct_answer(question)
+        self.refs.append(question.ref)
+        self.stems.append(question.text)
+        self.answers.append(correct)
+        self._parent.append(idx)
+
+        # A key seen before verbatim joins that question's cluster without
+        # being hashed again
+        first = self._exact.setdefault(question_key(question, correct), idx)
+        if first != idx:
+            self._signatures.append(self._signatures[first])
+            if self._signatures[first] is not None:
+                self._parent[idx] = self._find(first)
+            return
+
+        hashes = question_shingles(question, correct)
+        if not hashes:
+            self._signatures.append(None)
+            return
+        sig = signature(hashes)
+        self._signatures.append(sig)
+
+        width = SIGNATURE_SIZE // BANDS * sig.itemsize
+        packed = sig.tobytes()
+        checked = set()
+        for band in range(BANDS):
+            key = (band, packed[band * width:(band + 1) * width])
+            bucket = self._buckets.setdefault(key, [])
+            for other in bucket:
+                if other in checked:
+                    continue
+                checked.add(other)
+                root = self._find(other)
+                # Already in the same cluster through an earlier match
+                if root == self._find(idx):
+                    continue
+                self.candidates += 1
+                if similarity(sig, self._signatures[other]) >= self.threshold:
+                    self._parent[self._find(idx)] = root
+            if len(bucket) < BUCKET_SIZE:
+                bucket.append(idx)
+
+    def watch(self, questions):
+        # Pass-through: index each question as it streams to the renderer
+        for question in questions:
+            self.add(question)
+            yield question
+
+    def clusters(self):
+        groups = {}
+        for idx in range(len(self.refs)):
+            groups.setdefault(self._find(idx), []).append(idx)
+        return [members for members in groups.values() if len(members) > 1]
+
+    def report(self):
+        clusters = []
+        for members in self.clusters():
+            answers = {normalize_text(self.answers[idx]) for idx in members}
+            clusters.append({
+                'size': len(members),
+                # Same correct answer everywhere: a plain duplicate; otherwise
+                # near-identical questions disagree on what is correct
+                'answersMatch': len(answers) == 1,
+                'sources': sorted({self.refs[idx].split('#')[0] for idx in members}),
+                'questions': [
+                    {'ref': self.refs[idx], 'stem': self.stems[idx], 'answer': self.answers[idx]}
+                    for idx in members
+                ],
+            })
+        clusters.sort(key=lambda cluster: (-cluster['size'], cluster['questions'][0]['ref']))
+        return {
+            'questions': len(self.refs),
+            'threshold': self.threshold,
+            'candidatesChecked': self.candidates,
+            'clusters': len(clusters),
+            'duplicateQuestions': sum(cluster['size'] - 1 for cluster in clusters),
+            'crossSourceClusters': sum(1 for cluster in clusters if len(cluster['sources']) > 1),
+            'conflictingAnswers': sum(1 for cluster in clusters if not cluster['answersMatch']),
+            'duplicates': clusters,
+        }
+
+    def write_report(self, path):
+        report = self.report()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        return report
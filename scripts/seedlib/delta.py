@@ -0,0 +1,73 @@
+"""Deterministic row ids and per-lesson content-hash manifests for delta seeds."""
+
+import hashlib
+import json
+import os
+import uuid
+
+from .writer import write_atomic
+
+# Fixed namespace so the same logical row always gets the same id across runs
+SEED_NAMESPACE = uuid.UUID('6c1f3b0e-5d0a-5b8e-9a53-1d7e4f2c8a10')
+
+MANIFEST_VERSION = 1
+
+
+def row_id(*parts):
+    return str(uuid.uuid5(SEED_NAMESPACE, '/'.join(str(p) for p in parts)))
+
+
+def content_hash(payload):
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def load_manifest(path):
+    # A missing manifest means nothing has been applied yet (bootstrap run)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version in {path}: {data.get('version')!r}")
+    return data.get('lessons', {})
+
+
+def save_manifest(path, generator, lessons):
+    data = {
+        'version': MANIFEST_VERSION,
+        'generator': generator,
+        'lessons': lessons,
+    }
+    write_atomic(path, (json.dumps(data, indent=2, sort_keys=True) + '\n').encode('utf-8'))
+
+
+def pending_path(path):
+    # Where a delta run leaves its manifest until the SQL has been applied:
+    # "seed.manifest.json" -> "seed.manifest.pending.json"
+    root, ext = os.path.splitext(path)
+    return f"{root}.pending{ext}"
+
+
+def save_pending_manifest(path, generator, lessons):
+    # The manifest at `path` keeps describing what was last applied, so
+    # generating again before applying still diffs against the database
+    save_manifest(pending_path(path), generator, lessons)
+    return pending_path(path)
+
+
+def promote_manifest(path):
+    # Record the pending manifest as applied; call once its SQL has run
+    pending = pending_path(path)
+    if not os.path.exists(pending):
+        raise ValueError(f"No pending manifest at {pending}; generate a delta first")
+    os.replace(pending, path)
+
+
+def is_unchanged(previous, key, entry):
+    old = previous.get(key)
+    return old is not None and old.get('hash') == entry['hash']
+
+
+def removed_keys(previous, current):
+    return [key for key in previous if key not in current]
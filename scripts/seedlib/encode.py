@@ -0,0 +1,64 @@
+"""Cached options JSON for activity rows, shared across questions with the same options."""
+
+import collections
+
+from .sql import escape_sql_string
+
+# Distinct (options, answer) combinations kept; the least recently used is evicted
+DEFAULT_CACHE_SIZE = 1 << 14
+
+
+class OptionsEncoder:
+    # Answer texts repeat a lot ("Thank you", "Goodbye", "Respect"), and
+    # make_option already hands out one Option instance per (id, text), so the
+    # same option set shows up as an equal tuple over and over. The JSON and its
+    # escaped SQL literal are built once per distinct set and answer.
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = collections.OrderedDict()
+
+    def _entry(self, question):
+        key = (question.answer, question.options)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        # [json, sql literal]; the literal is only escaped if a renderer asks for it
+        entry = [question.options_json(), None]
+        if self.maxsize > 0:
+            if len(self._cache) >= self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+            self._cache[key] = entry
+        return entry
+
+    def json(self, question):
+        return self._entry(question)[0]
+
+    def sql(self, question):
+        # Escaped string literal, ready for `...::jsonb`
+        entry = self._entry(question)
+        if entry[1] is None:
+            entry[1] = escape_sql_string(entry[0])
+        return entry[1]
+
+    def summary(self):
+        lookups = self.hits + self.misses
+        return {
+            'lookups': lookups,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._cache),
+            'maxEntries': self.maxsize,
+            'dedupRatio': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+options_encoder = OptionsEncoder()
@@ -0,0 +1,280 @@
+"""Deterministic families, children and quest telemetry for benchmarking the telemetry rollup RPCs."""
+
+import datetime
+import random
+from dataclasses import dataclass
+
+from .delta import row_id
+from .sql import COPY_END, copy_header, copy_row, uuid_array
+
+DEFAULT_FAMILIES = 10
+DEFAULT_CHILDREN_PER_FAMILY = 100
+DEFAULT_DAYS = 365
+# A fixed last day keeps the output identical between runs; pass the real date
+# to line the rows up with "the last N days" style queries
+DEFAULT_END_DATE = datetime.date(2026, 2, 15)
+# Share of days an average child plays, and quest sessions on a day they do
+DEFAULT_ACTIVE_RATE = 0.6
+DEFAULT_SESSIONS_PER_DAY = 1.5
+# Lessons of the culture seed (its deterministic ids) completed in order
+DEFAULT_LESSONS = 10
+DEFAULT_SEED = 20260215
+
+# QuestTopic and the quest lengths in src/lib/supercharge/types.ts:
+# (mode, questions, share of sessions)
+QUEST_TOPICS = ('food', 'transport', 'shrines', 'school', 'phrases', 'culture', 'nature', 'general')
+QUEST_MODES = (('sixty', 5, 0.6), ('seventy_five', 9, 0.25), ('ninety', 13, 0.15))
+AGE_GROUPS = ('K-2', '3-5', '6-8', '9-12')
+
+AUTH_USER_COLUMNS = ('id',)
+PROFILE_COLUMNS = ('id', 'email', 'created_at')
+FAMILY_COLUMNS = ('id', 'name', 'created_at', 'created_by')
+FAMILY_MEMBER_COLUMNS = ('id', 'family_id', 'profile_id', 'role')
+CHILD_COLUMNS = ('id', 'family_id', 'name', 'age_group', 'created_at', 'streak_count', 'last_active_date', 'total_points')
+COMPLETION_COLUMNS = ('id', 'child_id', 'lesson_id', 'completed_at', 'score', 'duration_seconds')
+TELEMETRY_COLUMNS = (
+    'id', 'child_id', 'session_key', 'date_key', 'topic',
+    'total_count', 'generated_count', 'remixed_count', 'shortage_count', 'created_at',
+)
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+
+@dataclass(slots=True, frozen=True)
+class FixturePlan:
+    families: int = DEFAULT_FAMILIES
+    children_per_family: int = DEFAULT_CHILDREN_PER_FAMILY
+    days: int = DEFAULT_DAYS
+    end_date: datetime.date = DEFAULT_END_DATE
+    active_rate: float = DEFAULT_ACTIVE_RATE
+    sessions_per_day: float = DEFAULT_SESSIONS_PER_DAY
+    lessons: int = DEFAULT_LESSONS
+    seed: int = DEFAULT_SEED
+
+    def __post_init__(self):
+        if self.families < 1 or self.children_per_family < 1 or self.days < 1:
+            raise ValueError("families, children_per_family and days must be >= 1")
+        if not 0 < self.active_rate <= 1:
+            raise ValueError("active_rate must be in (0, 1]")
+        if self.sessions_per_day < 1:
+            raise ValueError("sessions_per_day must be >= 1")
+        if self.lessons < 0:
+            raise ValueError("lessons must be >= 0")
+
+    @property
+    def children(self):
+        return self.families * self.children_per_family
+
+    @property
+    def start_date(self):
+        return self.end_date - datetime.timedelta(days=self.days - 1)
+
+
+def family_id(family):
+    return row_id('fixture', 'family', family)
+
+
+def parent_id(family):
+    # One parent (auth user, profile and admin member) per family
+    return row_id('fixture', 'parent', family)
+
+
+def child_id(family, child):
+    return row_id('fixture', 'child', family, child)
+
+
+def _rng(plan, *parts):
+    # Every child gets its own streams, so a child's rows do not depend on how
+    # many children come before it or on the order the sections are written
+    return random.Random(':'.join(str(part) for part in (plan.seed, *parts)))
+
+
+def _random_id(rng):
+    # Rows nothing refers to get random (version 4) ids from the child's
+    # stream: deterministic, and much cheaper than a uuid5 or uuid.UUID each
+    bits = rng.getrandbits(128) & ~(0xF000 << 64 | 0xC000 << 48) | (0x4000 << 64 | 0x8000 << 48)
+    h = f"{bits:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _timestamp(day, seconds):
+    hours, rest = divmod(seconds, 3600)
+    return f"{day.isoformat()} {hours:02d}:{rest // 60:02d}:{rest % 60:02d}+00"
+
+
+def active_days(plan, family, child):
+    # Offsets (0 = start_date) of the days the child plays. Engagement varies
+    # per child around active_rate.
+    rng = _rng(plan, 'days', family, child)
+    rate = min(1.0, plan.active_rate * rng.uniform(0.5, 1.5))
+    return [offset for offset in range(plan.days) if rng.random() < rate]
+
+
+def _streak(days, last_offset):
+    # Consecutive active days ending on the last day of the range
+    streak = 0
+    for offset in reversed(days):
+        if offset != last_offset - streak:
+            break
+        streak += 1
+    return streak
+
+
+def _children(plan):
+    for family in range(1, plan.families + 1):
+        for child in range(1, plan.children_per_family + 1):
+            yield family, child
+
+
+def render_accounts(plan):
+    # Parents, families and children. Small (a few rows per child), so
+    # they are plain copy_row output.
+    created = _timestamp(plan.start_date - datetime.timedelta(days=30), 9 * 3600)
+    families = range(1, plan.families + 1)
+
+    yield copy_header('auth.users', AUTH_USER_COLUMNS)
+    for family in families:
+        yield copy_row(parent_id(family))
+    yield COPY_END
+
+    yield copy_header('public.profiles', PROFILE_COLUMNS)
+    for family in families:
+        yield copy_row(parent_id(family), f'parent{family}@fixture.test', created)
+    yield COPY_END
+
+    yield copy_header('public.families', FAMILY_COLUMNS)
+    for family in families:
+        yield copy_row(family_id(family), f'Fixture Family {family}', created, parent_id(family))
+    yield COPY_END
+
+    yield copy_header('public.family_members', FAMILY_MEMBER_COLUMNS)
+    for family in families:
+        yield copy_row(row_id('fixture', 'member', family), family_id(family), parent_id(family), 'admin')
+    yield COPY_END
+
+    yield copy_header('public.child_profiles', CHILD_COLUMNS)
+    last_offset = plan.days - 1
+    for family, child in _children(plan):
+        rng = _rng(plan, 'profile', family, child)
+        days = active_days(plan, family, child)
+        yield copy_row(
+            child_id(family, child),
+            family_id(family),
+            f'Child {family}-{child}',
+            rng.choice(AGE_GROUPS),
+            created,
+            _streak(days, last_offset),
+            (plan.start_date + datetime.timedelta(days=days[-1])).isoformat() if days else None,
+            len(days) * rng.randint(20, 60),
+        )
+    yield COPY_END
+
+
+def render_completions(plan, counts=None):
+    # Each child works through the seed's lessons in order, one every few
+    # active days, with a single row per (child, lesson) as the client upserts
+    lesson_ids = [row_id('culture', 'lesson', lesson) for lesson in range(1, plan.lessons + 1)]
+    rows = 0
+    yield copy_header('public.lesson_completions', COMPLETION_COLUMNS)
+    for family, child in _children(plan):
+        rng = _rng(plan, 'lessons', family, child)
+        cid = child_id(family, child)
+        days = active_days(plan, family, child)
+        gap = rng.randint(2, 6)
+        for lesson_id, offset in zip(lesson_ids, days[gap - 1::gap]):
+            day = plan.start_date + datetime.timedelta(days=offset)
+            yield (
+                f"{_random_id(rng)}\t{cid}\t{lesson_id}\t{_timestamp(day, rng.randrange(14 * 3600, 20 * 3600))}"
+                f"\t{rng.randint(60, 100)}\t{rng.randint(120, 900)}\n"
+            )
+            rows += 1
+    yield COPY_END
+    if counts is not None:
+        counts['lesson_completions'] = rows
+
+
+def render_telemetry(plan, counts=None):
+    # quest_plan_telemetry rows as buildQuestPlanTelemetryRows writes them:
+    # one per topic a session touched. This is the bulk of the fixture, so
+    # rows are formatted directly (none of the values need COPY escaping),
+    # draws use rng.random() rather than the slower randint/choices helpers,
+    # and each child's rows are yielded as one chunk.
+    more_sessions = 1 - 1 / plan.sessions_per_day
+    mode_thresholds = []
+    cumulative = 0.0
+    for mode, questions, share in QUEST_MODES:
+        cumulative += share
+        mode_thresholds.append((cumulative, mode, questions))
+    # Date key and epoch milliseconds of every day in the range
+    days = [plan.start_date + datetime.timedelta(days=offset) for offset in range(plan.days)]
+    day_keys = [day.isoformat() for day in days]
+    day_millis = [(day - _EPOCH).days * 86_400_000 for day in days]
+    rows = 0
+
+    yield copy_header('public.quest_plan_telemetry', TELEMETRY_COLUMNS)
+    for family, child in _children(plan):
+        rng = _rng(plan, 'telemetry', family, child)
+        random_ = rng.random
+        cid = child_id(family, child)
+        favorites = rng.sample(QUEST_TOPICS, 4)
+        favorites_twice = favorites * 2
+        chunk = []
+        for offset in active_days(plan, family, child):
+            date_key = day_keys[offset]
+            day_ms = day_millis[offset]
+            seconds = 14 * 3600 + int(random_() * 5 * 3600)
+            while True:
+                draw = random_() * cumulative
+                mode, questions = next((mode, questions) for limit, mode, questions in mode_thresholds if draw < limit)
+                hours, rest = divmod(seconds, 3600)
+                created_at = f"{date_key} {hours:02d}:{rest // 60:02d}:{rest % 60:02d}+00"
+                session_key = f"{day_ms + seconds * 1000 + int(random_() * 1000)}:{cid}:{mode}"
+                # Mostly a run of the child's favorite topics, sometimes any topics
+                count = 1 + int(random_() * min(4, questions))
+                if random_() < 0.8:
+                    start = int(random_() * 4)
+                    topics = favorites_twice[start:start + count]
+                else:
+                    topics = rng.sample(QUEST_TOPICS, count)
+                split = [1] * count
+                for _ in range(questions - count):
+                    split[int(random_() * count)] += 1
+                shortage = int(random_() * count) if random_() < 0.05 else -1
+                for index in range(count):
+                    total = split[index]
+                    generated = int(random_() * (total // 2 + 1))
+                    remixed = int(random_() * ((total - generated) // 2 + 1))
+                    chunk.append(
+                        f"{_random_id(rng)}\t{cid}\t{session_key}\t{date_key}\t{topics[index]}"
+                        f"\t{total}\t{generated}\t{remixed}\t{int(index == shortage)}\t{created_at}\n"
+                    )
+                rows += count
+                seconds += 300 + int(random_() * 1500)
+                if seconds >= 86_400 or random_() >= more_sessions:
+                    break
+        yield "".join(chunk)
+    yield COPY_END
+    if counts is not None:
+        counts['quest_plan_telemetry'] = rows
+
+
+def render_fixture(plan, counts=None):
+    # psql script: remove the rows of any earlier fixture (by their fixed
+    # ids; families cascade to members, children and their rows), then COPY
+    # the new ones in parent-first order, all in one transaction
+    families = range(1, plan.families + 1)
+    yield (
+        f"-- Quest telemetry fixture: {plan.families} families x {plan.children_per_family} children, "
+        f"{plan.start_date.isoformat()} to {plan.end_date.isoformat()}, seed {plan.seed}\n"
+        "-- Apply with psql: COPY ... FROM STDIN sections need a client that streams them.\n"
+        "BEGIN;\n\n"
+        f"DELETE FROM public.families WHERE id = ANY({uuid_array(family_id(family) for family in families)});\n"
+        f"DELETE FROM auth.users WHERE id = ANY({uuid_array(parent_id(family) for family in families)});\n\n"
+    )
+    yield from render_accounts(plan)
+    if plan.lessons:
+        yield "\n"
+        yield from render_completions(plan, counts)
+    yield "\n"
+    yield from render_telemetry(plan, counts)
+    yield "\nANALYZE public.child_profiles;\nANALYZE public.quest_plan_telemetry;\n\nCOMMIT;\n"
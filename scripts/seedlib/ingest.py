@@ -0,0 +1,141 @@
+"""Read every content source into one question model, in parallel."""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .model import Question, make_option
+from .scan import CONTEXT_PREFIX, LAYOUTS, SEPARATOR_PREFIX, scan_questions
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+# (kind, path relative to the repo root). The order here is the merge order.
+DEFAULT_SOURCES = (
+    ('culture', 'supabase/raw_culture_questions.txt'),
+    ('blocks', 'raw_questions.txt'),
+    ('topics', 'scripts/generate_update_sql.py'),
+    ('facts', 'public/data/supercharge_facts.json'),
+    ('facts', 'public/data/supercharge_facts.v1.json'),
+    ('facts', 'public/data/supercharge_facts.review.json'),
+)
+
+# Text sources larger than this are split into several work units
+DEFAULT_CHUNK_BYTES = 4 << 20
+
+
+def _is_block_start(kind, line):
+    # A line that can only appear at the start of a question block
+    if kind == 'culture':
+        return line.startswith(CONTEXT_PREFIX.encode())
+    return line.strip().startswith(SEPARATOR_PREFIX.encode())
+
+
+def _aligned_offset(f, kind, offset):
+    # Move `offset` forward to the next block boundary so work units never split a block
+    f.seek(offset)
+    f.readline()  # skip the (possibly partial) line we landed in
+    while True:
+        pos = f.tell()
+        line = f.readline()
+        if not line or _is_block_start(kind, line):
+            return pos
+
+
+def plan_units(sources, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    # Work units are (source_idx, chunk_idx, kind, path, start, end); they sort
+    # into the deterministic merge order.
+    units = []
+    for source_idx, (kind, path) in enumerate(sources):
+        if kind not in LAYOUTS:
+            units.append((source_idx, 0, kind, path, 0, None))
+            continue
+
+        size = os.path.getsize(path)
+        bounds = [0]
+        with open(path, 'rb') as f:
+            for offset in range(chunk_bytes, size, chunk_bytes):
+                aligned = _aligned_offset(f, kind, offset)
+                if aligned > bounds[-1] and aligned < size:
+                    bounds.append(aligned)
+        bounds.append(size)
+        for chunk_idx, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            units.append((source_idx, chunk_idx, kind, path, start, end))
+    return units
+
+
+def _read_text(kind, path, start, end):
+    return list(scan_questions(path, kind, start, end, source=sys.intern(os.path.relpath(path, REPO_ROOT))))
+
+
+def _read_topics(path):
+    # The topics list lives in a Python literal inside the update generator
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location('_ingest_topics', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    source = os.path.relpath(path, REPO_ROOT)
+    questions = []
+    for lesson in module.load_lessons():
+        for question in lesson.questions:
+            question.source = source
+            question.key = lesson.lesson_id
+            question.context = lesson.intro
+            question.topic = lesson.title
+            questions.append(question)
+    return questions
+
+
+def _read_facts(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        facts = json.load(f)
+
+    source = os.path.relpath(path, REPO_ROOT)
+    questions = []
+    for fact in facts:
+        # Correct answer first; the client shuffles options at render time
+        texts = [fact['correctAnswer']] + list(fact.get('distractors', []))
+        questions.append(Question(
+            prompt=fact['question'],
+            options=tuple(make_option(chr(ord('A') + i), text) for i, text in enumerate(texts)),
+            answer='A',
+            context=fact.get('story', ""),
+            source=source,
+            key=fact['id'],
+            topic=fact.get('topic'),
+            difficulty=fact.get('difficulty'),
+        ))
+    return questions
+
+
+def read_unit(unit):
+    _, _, kind, path, start, end = unit
+    if kind in LAYOUTS:
+        return _read_text(kind, path, start, end)
+    if kind == 'topics':
+        return _read_topics(path)
+    if kind == 'facts':
+        return _read_facts(path)
+    raise ValueError(f"Unknown source kind: {kind}")
+
+
+def resolve_sources(sources=DEFAULT_SOURCES, root=REPO_ROOT):
+    return [(kind, os.path.join(root, path)) for kind, path in sources]
+
+
+def ingest(sources=None, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    # Yield every question from every source. Units are parsed in a process
+    # pool, and results come back in unit order, so the merged stream is the
+    # same no matter how many workers ran or which finished first.
+    units = plan_units(sources or resolve_sources(), chunk_bytes)
+
+    if workers == 1 or len(units) == 1:
+        for unit in units:
+            yield from read_unit(unit)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for questions in pool.map(read_unit, units):
+            yield from questions
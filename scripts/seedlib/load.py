@@ -0,0 +1,122 @@
+"""Apply generated content straight to Postgres instead of writing a .sql file.
+
+Needs psycopg 3 with its pool (`pip install "psycopg[binary,pool]"`); the rest of
+seedlib works without it, so it is only imported when a loader is created.
+"""
+
+import concurrent.futures
+import itertools
+
+DEFAULT_WORKERS = 4
+# Units (e.g. levels with their lessons and activities) committed per transaction
+DEFAULT_UNITS_PER_TRANSACTION = 10
+
+
+def _psycopg_pool():
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError as exc:
+        raise RuntimeError(
+            'Loading into Postgres needs psycopg 3 and its pool: pip install "psycopg[binary,pool]"'
+        ) from exc
+    return ConnectionPool
+
+
+def insert_sql(table, columns, casts=None):
+    # Parameterized single-row INSERT; executemany batches and pipelines the rows
+    casts = casts or {}
+    placeholders = ", ".join(f"%s::{casts[column]}" if column in casts else "%s" for column in columns)
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+class Loader:
+    # A unit is a list of (insert_sql, rows) pairs, parents first, that has to
+    # land in one transaction (a level with its lessons and activities). Units
+    # are grouped `units_per_transaction` at a time and the groups are loaded
+    # concurrently, one pooled connection each. Only `workers * 2` groups are
+    # in flight at once, so a large corpus is never held in memory whole.
+    def __init__(self, dsn, workers=DEFAULT_WORKERS, units_per_transaction=DEFAULT_UNITS_PER_TRANSACTION):
+        ConnectionPool = _psycopg_pool()
+        self.workers = workers
+        self.units_per_transaction = units_per_transaction
+        # prepare_threshold=0: every statement is prepared server-side on first use,
+        # so each worker parses each INSERT once
+        self.pool = ConnectionPool(
+            dsn,
+            min_size=1,
+            max_size=workers,
+            kwargs={'prepare_threshold': 0},
+            open=True,
+        )
+
+    def close(self):
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, query, params=None):
+        # One statement in its own transaction; returns the fetched rows, if any
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                cur = conn.execute(query, params)
+                return cur.fetchall() if cur.description else []
+
+    def run_script(self, fragments):
+        # Apply a rendered script (which carries its own BEGIN/COMMIT) fragment
+        # by fragment on one autocommit connection, as psql would
+        from psycopg.pq import TransactionStatus
+
+        with self.pool.connection() as conn:
+            conn.autocommit = True
+            try:
+                for fragment in fragments:
+                    # Without parameters or preparation psycopg sends the
+                    # fragment as a simple query, so it may hold several statements
+                    if fragment.strip():
+                        conn.execute(fragment, prepare=False)
+            finally:
+                # A failed fragment leaves the script's own transaction open
+                # and aborted, where psycopg refuses to change autocommit (and
+                # that error would replace the real one): roll it back first.
+                # A broken connection is left for the pool to discard.
+                status = conn.info.transaction_status
+                if status in (TransactionStatus.INTRANS, TransactionStatus.INERROR):
+                    conn.rollback()
+                    status = conn.info.transaction_status
+                if status == TransactionStatus.IDLE:
+                    conn.autocommit = False
+
+    def _load_group(self, group):
+        # Rows of every unit in the group, merged per statement in first-seen
+        # (parents first) order
+        merged = {}
+        for unit in group:
+            for query, rows in unit:
+                merged.setdefault(query, []).extend(rows)
+
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                with conn.cursor() as cur:
+                    for query, rows in merged.items():
+                        cur.executemany(query, rows)
+        return {query: len(rows) for query, rows in merged.items()}
+
+    def load(self, units):
+        # Yields the per-statement row counts of each committed transaction
+        units = iter(units)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            while True:
+                group = list(itertools.islice(units, self.units_per_transaction))
+                if group:
+                    pending.add(executor.submit(self._load_group, group))
+                if pending and (not group or len(pending) >= self.workers * 2):
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                if not group and not pending:
+                    return
@@ -0,0 +1,87 @@
+"""Compact records for questions, options and lessons shared by the generators."""
+
+import json
+import sys
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Option:
+    id: str
+    text: str
+
+
+# Answer texts repeat a lot across a corpus ("Thank you", "Respect", ...), so
+# equal options share one instance. Cleared when full to keep memory bounded.
+OPTION_CACHE_SIZE = 1 << 16
+_option_cache = {}
+
+
+def make_option(option_id, text):
+    # Option ids come from a tiny alphabet ("A"-"C", "1"-"3"); interning them
+    # means every question shares the same few id strings.
+    key = (option_id, text)
+    option = _option_cache.get(key)
+    if option is None:
+        if len(_option_cache) >= OPTION_CACHE_SIZE:
+            _option_cache.clear()
+        option = _option_cache[key] = Option(sys.intern(option_id), text)
+    return option
+
+
+@dataclass(slots=True)
+class Question:
+    prompt: str
+    options: tuple
+    answer: str = ""
+    context: str = ""
+    number: int = 0
+    source: str = ""
+    key: str = None
+    topic: str = None
+    difficulty: str = None
+
+    @property
+    def ref(self):
+        # Built on demand; text banks are referenced by question number, other
+        # sources by their own id (fact id, lesson id)
+        if self.key is not None:
+            return f"{self.source}#{self.key}"
+        return f"{self.source}#Q{self.number}"
+
+    @property
+    def text(self):
+        # Context and prompt as stored in activities.question_text
+        return f"{self.context}\n\n{self.prompt}" if self.context else self.prompt
+
+    def options_payload(self):
+        return [
+            {"id": opt.id, "text": opt.text, "is_correct": (opt.id == self.answer)}
+            for opt in self.options
+        ]
+
+    def options_json(self):
+        # Serialized only when a renderer actually needs the JSONB value
+        return json.dumps(self.options_payload())
+
+    def to_dict(self):
+        return {
+            'source': self.source,
+            'ref': self.ref,
+            'context': self.context,
+            'question': self.prompt,
+            'options': [[opt.id, opt.text] for opt in self.options],
+            'answer': self.answer,
+            'topic': self.topic,
+            'difficulty': self.difficulty,
+        }
+
+
+@dataclass(slots=True)
+class Lesson:
+    level_id: str
+    lesson_id: str
+    title: str
+    description: str
+    intro: str
+    questions: tuple
@@ -0,0 +1,194 @@
+"""Single-pass question block scanner over a memory-mapped question bank."""
+
+import contextlib
+import mmap
+import re
+import sys
+
+from .model import Question, make_option
+
+LAYOUTS = ('culture', 'blocks')
+
+# Line prefixes that open a question block in each layout
+CONTEXT_PREFIX = "- "
+SEPARATOR_PREFIX = "----"
+
+# One pattern matches a whole question block, so the file is walked once by the
+# regex engine instead of line by line in Python. Fields are captured up to the
+# end of their line and stripped after decoding. Banks use options A-C, but any
+# capital letter is read so that a stray "D." line is part of its block (and
+# flagged by seedlib.validate) instead of cutting the block short.
+_QUESTION = rb"""
+    ^[ \t]*Question[ ](?P<number>\d+):[ ](?P<prompt>[^\n]*)(?:\n|\Z)
+    (?P<options>(?:(?:[ \t\r]*\n)*[ \t]*[A-Z]\.[ ][^\n]*(?:\n|\Z))*)
+    (?:(?:[ \t\r]*\n)*[ \t]*Answer:[ ](?P<answer>[A-Z]))?
+"""
+
+# - Context text
+#   Question X: ...
+#   A. ... / B. ... / C. ...
+#   Answer: ...
+CULTURE_BLOCK_RE = re.compile(
+    rb"(?:^[ \t]*-[ ](?P<context>[^\n]*)\n(?:[ \t\r]*\n)*)?" + _QUESTION,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# Unprefixed context line(s), the question block, then a "----" separator
+BLOCK_RE = re.compile(
+    rb"(?P<context>(?:^[ \t]*(?!Question[ ]\d+:[ ]|-{4})\S[^\n]*\n(?:[ \t\r]*\n)*)*)" + _QUESTION,
+    re.MULTILINE | re.VERBOSE,
+)
+
+PATTERNS = {
+    'culture': CULTURE_BLOCK_RE,
+    'blocks': BLOCK_RE,
+}
+
+OPTION_LINE_RE = re.compile(rb"^[ \t]*([A-Z])\.[ ]([^\n]*)", re.MULTILINE)
+
+# Lines between two blocks that are neither blank nor a separator
+STRAY_TEXT_RE = re.compile(rb"^[ \t]*(?!-{4})\S", re.MULTILINE)
+
+FIRST_QUESTION_RE = re.compile(rb"^[ \t]*Question[ ]\d+:[ ]", re.MULTILINE)
+LAST_LINE_RE = re.compile(rb"^[ \t]*(\S[^\n]*)\n(?:[ \t\r]*\n)*\Z", re.MULTILINE)
+
+# Distinct raw option blocks remembered per scan
+OPTIONS_CACHE_SIZE = 1 << 14
+
+# Bytes sniffed by detect_layout
+DETECT_BYTES = 64 * 1024
+
+
+def detect_layout(data, start=0):
+    # The line just above the first question decides: "- context" is the
+    # culture layout, anything else (plain context, a "----" separator) is the
+    # block layout. A bank that opens with a bare question reads as culture.
+    head = data[start:start + DETECT_BYTES]
+    match = FIRST_QUESTION_RE.search(head)
+    if match is None:
+        return 'culture'
+    previous = LAST_LINE_RE.search(head, 0, match.start())
+    if previous is None or previous.group(1).startswith(b"- "):
+        return 'culture'
+    return 'blocks'
+
+
+def _context(layout, raw):
+    if raw is None:
+        return ""
+    if layout == 'culture':
+        return raw.decode('utf-8').rstrip()
+    return " ".join(line.strip() for line in raw.decode('utf-8').splitlines() if line.strip())
+
+
+def _parse_options(raw):
+    return tuple(
+        make_option(sys.intern(option_id.decode()), text.decode('utf-8').rstrip())
+        for option_id, text in OPTION_LINE_RE.findall(raw)
+    )
+
+
+def _scan(data, layout, start, end, counts, source, validator):
+    pattern = PATTERNS[layout]
+    # The same option lines repeat across a bank, so whole option tuples are
+    # reused by their raw bytes (bounded like seedlib.model's option cache)
+    options_cache = {}
+    blocks = context_missing = option_hits = answer_missing = stray = 0
+    position = start
+    try:
+        for match in pattern.finditer(data, start, end):
+            for skipped in STRAY_TEXT_RE.finditer(data, position, match.start()):
+                stray += 1
+                if validator is not None:
+                    validator.stray(skipped.start())
+            position = match.end()
+
+            # Groups in pattern order: context, number, prompt, options, answer
+            raw_context, number, prompt, raw_options, answer = match.groups()
+            context = _context(layout, raw_context)
+            if not context:
+                context_missing += 1
+
+            options = options_cache.get(raw_options)
+            if options is None:
+                if len(options_cache) >= OPTIONS_CACHE_SIZE:
+                    options_cache.clear()
+                options = options_cache[raw_options] = _parse_options(raw_options)
+            option_hits += len(options)
+
+            if answer is None:
+                answer_missing += 1
+            blocks += 1
+
+            question = Question(
+                prompt=prompt.decode('utf-8').rstrip(),
+                options=options,
+                answer=sys.intern(answer.decode()) if answer is not None else "",
+                context=context,
+                number=int(number),
+                source=source,
+            )
+            if validator is not None:
+                validator.check(match, question)
+            yield question
+        for skipped in STRAY_TEXT_RE.finditer(data, position, end):
+            stray += 1
+            if validator is not None:
+                validator.stray(skipped.start())
+    finally:
+        if counts is not None:
+            counts.update({
+                'question.matched': blocks,
+                'context.matched': blocks - context_missing,
+                'context.missing': context_missing,
+                'option.matched': option_hits,
+                'answer.matched': blocks - answer_missing,
+                'answer.missing': answer_missing,
+                'text.skipped': stray,
+            })
+
+
+@contextlib.contextmanager
+def _mapped(path):
+    # Read-only mmap of `path`, or None for an empty file (which cannot be mapped)
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            yield None
+            return
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        finally:
+            data.close()
+
+
+def _resolve_layout(data, layout, start=0):
+    if layout is None:
+        return detect_layout(data, start)
+    if layout not in PATTERNS:
+        raise ValueError(f"Unknown layout: {layout}")
+    return layout
+
+
+def scan_questions(path, layout=None, start=0, end=None, counts=None, source="", validator=None):
+    # Yield every question block in `path` (optionally only the byte range
+    # [start, end), aligned to block boundaries as seedlib.ingest does).
+    # `layout` is 'culture', 'blocks' or None to detect it from the file;
+    # `source` is recorded on each question (see Question.ref). A
+    # seedlib.validate.Validator checks each block before it is yielded.
+    with _mapped(path) as data:
+        if data is None:
+            return
+        layout = _resolve_layout(data, layout, start)
+        if validator is not None:
+            validator.begin(data, path)
+        yield from _scan(data, layout, start, len(data) if end is None else end, counts, source, validator)
+
+
+def count_questions(path, layout=None):
+    # Number of blocks scan_questions would yield, without building any of them
+    with _mapped(path) as data:
+        if data is None:
+            return 0
+        pattern = PATTERNS[_resolve_layout(data, layout)]
+        return sum(1 for _ in pattern.finditer(data))
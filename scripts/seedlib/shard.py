@@ -0,0 +1,129 @@
+"""Split a question stream into lessons and levels with order_index ranges."""
+
+import itertools
+from dataclasses import dataclass
+
+DEFAULT_LESSON_SIZE = 20
+DEFAULT_LESSONS_PER_LEVEL = 1
+# The culture seed has always owned the levels right after the branch's first ten
+DEFAULT_ORDER_START = 10
+# ... and cleared ten of them (order_index 11-20). A smaller bank still clears
+# that many, so levels an earlier, larger run wrote do not linger.
+DEFAULT_CLEARED_LEVELS = 10
+
+
+@dataclass(slots=True)
+class Shard:
+    level_num: int
+    lesson_num: int
+    order_start: int
+    start_idx: int
+    questions: list
+    first_in_level: bool
+
+    @property
+    def level_order(self):
+        return self.order_start + self.level_num
+
+    @property
+    def lesson_order(self):
+        # Lessons count up from the same start, so one lesson per level keeps
+        # level and lesson order_index equal
+        return self.order_start + self.lesson_num
+
+
+@dataclass(slots=True, frozen=True)
+class ShardPlan:
+    # Levels get order_index order_start + 1 .. order_start + levels in their
+    # branch. The seed owns, and clears before inserting, that range or up to
+    # order_end if that is higher (see clear_range).
+    questions: int
+    lesson_size: int = DEFAULT_LESSON_SIZE
+    lessons_per_level: int = DEFAULT_LESSONS_PER_LEVEL
+    order_start: int = DEFAULT_ORDER_START
+    max_lessons: int = None
+    order_end: int = None
+
+    def __post_init__(self):
+        if self.lesson_size < 1 or self.lessons_per_level < 1:
+            raise ValueError("lesson_size and lessons_per_level must be >= 1")
+        if self.order_end is not None and self.order_end <= self.order_start:
+            raise ValueError("order_end must be greater than order_start")
+
+    @property
+    def lessons(self):
+        lessons = -(-self.questions // self.lesson_size)
+        return lessons if self.max_lessons is None else min(lessons, self.max_lessons)
+
+    @property
+    def levels(self):
+        return -(-self.lessons // self.lessons_per_level)
+
+    @property
+    def order_range(self):
+        # (exclusive low, inclusive high), as used in "order_index > low AND order_index <= high"
+        return self.order_start, self.order_start + self.levels
+
+    @property
+    def clear_range(self):
+        # order_range, widened up to order_end (default order_start +
+        # DEFAULT_CLEARED_LEVELS); same (exclusive, inclusive) form
+        end = self.order_start + DEFAULT_CLEARED_LEVELS if self.order_end is None else self.order_end
+        return self.order_start, max(self.order_start + self.levels, end)
+
+    def shards(self, questions):
+        # Hold one lesson of questions at a time; anything past max_lessons is left unread
+        questions = iter(questions)
+        for lesson_idx in range(self.lessons):
+            lesson_questions = list(itertools.islice(questions, self.lesson_size))
+            if not lesson_questions:
+                break
+            level_idx, position = divmod(lesson_idx, self.lessons_per_level)
+            yield Shard(
+                level_num=level_idx + 1,
+                lesson_num=lesson_idx + 1,
+                order_start=self.order_start,
+                start_idx=lesson_idx * self.lesson_size,
+                questions=lesson_questions,
+                first_in_level=position == 0,
+            )
+
+
+# Mirrors inferTopicFromQuestion in src/lib/supercharge/contentUtils.ts,
+# checked in this order; anything else is 'culture'
+TOPIC_KEYWORDS = (
+    ('food', ('sushi', 'ramen', 'onigiri', 'food')),
+    ('transport', ('train', 'station', 'bus', 'transport')),
+    ('phrases', ('konnichiwa', 'arigato', 'phrase', 'hello')),
+    ('shrines', ('shrine', 'temple', 'torii')),
+    ('school', ('school', 'class')),
+    ('nature', ('park', 'mountain', 'flower')),
+)
+FALLBACK_TOPIC = 'culture'
+
+
+def infer_topic(text):
+    lower = text.lower()
+    for topic, words in TOPIC_KEYWORDS:
+        if any(word in lower for word in words):
+            return topic
+    return FALLBACK_TOPIC
+
+
+def question_topic(question):
+    # Text banks carry no topic, so like the client (fetchQuestContent) fall
+    # back to inferring one from the question text
+    return question.topic or infer_topic(question.text)
+
+
+def balance_by_topic(questions, key=question_topic):
+    # Round-robin across topics (in order of first appearance) so consecutive
+    # lessons mix topics instead of exhausting one before the next. Needs the
+    # whole corpus in memory, unlike the streaming path.
+    buckets = {}
+    for question in questions:
+        buckets.setdefault(key(question), []).append(question)
+    balanced = []
+    for group in itertools.zip_longest(*buckets.values()):
+        balanced.extend(question for question in group if question is not None)
+    return balanced
@@ -0,0 +1,191 @@
+"""Seeds split into self-contained SQL files plus a manifest, applied in parallel and resumably."""
+
+import collections
+import concurrent.futures
+import hashlib
+import json
+import os
+
+from .load import DEFAULT_WORKERS
+from .writer import write_atomic
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+# Appended to by apply_shards, one {"name", "sha256"} line per applied shard
+STATE_NAME = 'applied.jsonl'
+
+
+def _write_json(path, payload):
+    write_atomic(path, (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode('utf-8'))
+
+
+class ShardSetWriter:
+    # Each shard is one file, `<name>.sql`, that must apply on its own (one
+    # transaction). The manifest lists shards in apply order with the names
+    # they depend on and the sha256 of each file. Nothing in it depends on the
+    # time of the run, so unchanged content gives an unchanged manifest.
+    # `previous` is the manifest already in the directory (or None), for
+    # shards that have to undo what the last run wrote.
+    def __init__(self, output_dir, generator, **meta):
+        self.output_dir = output_dir
+        self.generator = generator
+        self.meta = meta
+        self.shards = []
+        self._names = set()
+        self.bytes_written = 0
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, MANIFEST_NAME)
+        self.previous = load_shard_manifest(output_dir) if os.path.exists(path) else None
+
+    def add(self, name, fragments, depends_on=(), position=None, **meta):
+        # `position` puts the shard earlier in the apply order than the order
+        # it was added in, e.g. a preparation step only known once all
+        # content shards are written
+        if name in self._names:
+            raise ValueError(f"Duplicate shard name: {name}")
+        self._names.add(name)
+        data = "".join(fragments).encode('utf-8')
+        entry = {
+            'name': name,
+            'file': f"{name}.sql",
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'bytes': len(data),
+            'dependsOn': list(depends_on),
+            **meta,
+        }
+        write_atomic(os.path.join(self.output_dir, entry['file']), data)
+        self.bytes_written += len(data)
+        self.shards.insert(len(self.shards) if position is None else position, entry)
+        return entry
+
+    def finish(self):
+        # Write the manifest, then remove files that only the previous
+        # manifest listed. Returns (manifest, removed file names).
+        path = os.path.join(self.output_dir, MANIFEST_NAME)
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'generator': self.generator,
+            **self.meta,
+            'shards': self.shards,
+        }
+        _validate(manifest, path)
+        _write_json(path, manifest)
+
+        current = {shard['file'] for shard in self.shards}
+        removed = []
+        for shard in self.previous['shards'] if self.previous else ():
+            stale = os.path.join(self.output_dir, shard['file'])
+            if shard['file'] not in current and os.path.exists(stale):
+                os.remove(stale)
+                removed.append(shard['file'])
+        return manifest, removed
+
+
+def _validate(manifest, path):
+    # Dependencies must name an earlier shard, which also rules out cycles
+    seen = set()
+    for shard in manifest['shards']:
+        missing = [dep for dep in shard['dependsOn'] if dep not in seen]
+        if missing:
+            raise ValueError(f"{path}: shard {shard['name']} depends on {', '.join(missing)}, which is not listed before it")
+        seen.add(shard['name'])
+
+
+def load_shard_manifest(shard_dir):
+    path = os.path.join(shard_dir, MANIFEST_NAME)
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported shard manifest version in {path}: {manifest.get('version')!r}")
+    _validate(manifest, path)
+    return manifest
+
+
+def load_state(shard_dir):
+    # {shard name: sha256 last applied}; later lines win
+    path = os.path.join(shard_dir, STATE_NAME)
+    state = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    state[entry['name']] = entry['sha256']
+    return state
+
+
+def _read_shard(shard_dir, shard):
+    with open(os.path.join(shard_dir, shard['file']), 'rb') as f:
+        data = f.read()
+    if hashlib.sha256(data).hexdigest() != shard['sha256']:
+        raise ValueError(f"{shard['file']} does not match its manifest checksum; regenerate the shards")
+    return data.decode('utf-8')
+
+
+def apply_shards(shard_dir, run, workers=DEFAULT_WORKERS, force=False, on_done=None):
+    # Apply every shard whose dependencies have been applied, up to `workers`
+    # at a time; `run(sql)` applies one shard's SQL. A shard recorded in the
+    # state file with its current checksum is skipped (unless `force`), so a
+    # rerun only applies what failed or changed. A failed shard's dependents
+    # are not attempted. `on_done(name, outcome, error)` is called as each
+    # shard settles. Returns {'applied', 'skipped', 'failed', 'blocked'},
+    # lists of names except 'failed', which maps names to error messages.
+    manifest = load_shard_manifest(shard_dir)
+    state = {} if force else load_state(shard_dir)
+    shards = {shard['name']: shard for shard in manifest['shards']}
+    waiting = {name: set(shard['dependsOn']) for name, shard in shards.items()}
+    dependents = collections.defaultdict(list)
+    for name, shard in shards.items():
+        for dep in shard['dependsOn']:
+            dependents[dep].append(name)
+
+    results = {'applied': [], 'skipped': [], 'failed': {}, 'blocked': []}
+    ready = collections.deque(name for name, deps in waiting.items() if not deps)
+
+    def settle(name, outcome, error=None):
+        if outcome == 'failed':
+            results['failed'][name] = error
+        else:
+            results[outcome].append(name)
+        if on_done:
+            on_done(name, outcome, error)
+        for child in dependents[name]:
+            if outcome in ('applied', 'skipped'):
+                waiting[child].discard(name)
+                if not waiting[child]:
+                    ready.append(child)
+            elif child in waiting:
+                # Blocked: never run, and neither is anything that needs it
+                del waiting[child]
+                settle(child, 'blocked')
+        waiting.pop(name, None)
+
+    with open(os.path.join(shard_dir, STATE_NAME), 'a', encoding='utf-8') as log, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {}
+        while ready or running:
+            while ready:
+                name = ready.popleft()
+                if name not in waiting:
+                    continue
+                if state.get(name) == shards[name]['sha256']:
+                    settle(name, 'skipped')
+                    continue
+                future = executor.submit(lambda shard: run(_read_shard(shard_dir, shard)), shards[name])
+                running[future] = name
+            if not running:
+                break
+            finished, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    future.result()
+                except Exception as exc:
+                    # Reported per shard; independent shards carry on
+                    settle(name, 'failed', str(exc).strip() or type(exc).__name__)
+                else:
+                    # Recorded as soon as it commits, so an interrupted run resumes here
+                    log.write(json.dumps({'name': name, 'sha256': shards[name]['sha256']}) + "\n")
+                    log.flush()
+                    settle(name, 'applied')
+    return results
@@ -0,0 +1,84 @@
+"""SQL literal escaping, set-based statement builders and COPY text-format helpers."""
+
+import itertools
+
+# COPY text format: backslash first, then the characters COPY treats as delimiters
+_COPY_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+COPY_NULL = "\\N"
+COPY_END = "\\.\n"
+
+
+def escape_sql_string(s):
+    if s is None:
+        return 'NULL'
+    # Escape single quotes by doubling them
+    return "'" + s.replace("'", "''") + "'"
+
+
+def copy_field(value):
+    # Render one column value for a tab-separated COPY ... FROM STDIN row.
+    # JSONB values are passed in already serialized; their backslashes are
+    # escaped like any other text so Postgres sees the original JSON.
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_row(*values):
+    return "\t".join(copy_field(v) for v in values) + "\n"
+
+
+def copy_header(table, columns):
+    return f"COPY {table} ({', '.join(columns)}) FROM STDIN;\n"
+
+
+def uuid_array(ids):
+    return "ARRAY[" + ", ".join(f"'{i}'" for i in ids) + "]::uuid[]"
+
+
+def chunked(iterable, size):
+    # Split an iterable into lists of at most `size` items
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def insert_statement(table, columns, rows, indent="", upsert=False):
+    # Multi-row INSERT; rows are lists of SQL literals. With upsert=True rows
+    # that already exist (by primary key) are updated in place.
+    values = f",\n{indent}".join("(" + ", ".join(row) + ")" for row in rows)
+    statement = (
+        f"{indent}INSERT INTO {table} ({', '.join(columns)}) VALUES\n"
+        f"{indent}{values}\n"
+    )
+    if upsert:
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c != 'id')
+        statement += f"{indent}ON CONFLICT (id) DO UPDATE SET {updates}"
+    return statement.rstrip("\n") + ";\n"
+
+
+def upsert_statement(table, columns, rows, indent=""):
+    return insert_statement(table, columns, rows, indent=indent, upsert=True)
+
+
+def update_from_values(table, columns, rows, key='id', key_type='uuid'):
+    # One UPDATE ... FROM (VALUES ...) for many rows. Each row is the key
+    # literal followed by one literal per column.
+    values = ",\n".join("    (" + ", ".join(row) + ")" for row in rows)
+    assignments = ", ".join(f"{c} = v.{c}" for c in columns)
+    return (
+        f"UPDATE {table} AS t SET {assignments}\n"
+        f"FROM (VALUES\n{values}\n) AS v({key}, {', '.join(columns)})\n"
+        f"WHERE t.{key} = v.{key}::{key_type};\n"
+    )
@@ -0,0 +1,102 @@
+"""Per-stage wall time and counters for the seed generators (--stats)."""
+
+import collections
+import contextlib
+import json
+import re
+import sys
+import time
+
+# Statement verb + target table in generated SQL
+STATEMENT_RE = re.compile(r"^\s*(INSERT INTO|UPDATE|DELETE FROM|COPY)\s+([\w.]+)", re.MULTILINE)
+
+
+class Stats:
+    # Stages nest (write pulls from render, which pulls from parse and calls
+    # encode), so time is charged to whichever stage is innermost at the
+    # moment: each stage reports its own work, not that of the stages it calls.
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stage_seconds = collections.defaultdict(float)
+        self.counters = collections.Counter()
+        self.statements = collections.Counter()
+        self._stack = []
+        self._mark = None
+        self._started = time.perf_counter()
+
+    def _enter(self, stage):
+        now = time.perf_counter()
+        if self._stack:
+            self.stage_seconds[self._stack[-1]] += now - self._mark
+        self._stack.append(stage)
+        self._mark = now
+
+    def _exit(self):
+        now = time.perf_counter()
+        self.stage_seconds[self._stack.pop()] += now - self._mark
+        self._mark = now
+
+    @contextlib.contextmanager
+    def _timed_block(self, stage):
+        self._enter(stage)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def stage(self, stage):
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timed_block(stage)
+
+    def timed(self, stage, iterable):
+        # Charge the time spent producing each item of `iterable` to `stage`
+        if not self.enabled:
+            return iterable
+        return self._timed_iter(stage, iter(iterable))
+
+    def _timed_iter(self, stage, iterator):
+        while True:
+            self._enter(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            yield item
+
+    def count(self, key, n=1):
+        if self.enabled:
+            self.counters[key] += n
+
+    def merge_counts(self, counts):
+        if self.enabled:
+            self.counters.update(counts)
+
+    def count_statements(self, fragment):
+        if self.enabled:
+            for verb, table in STATEMENT_RE.findall(fragment):
+                self.statements[f"{verb.split()[0].lower()} {table}"] += 1
+
+    def summary(self, **extra):
+        return {
+            'wallSeconds': round(time.perf_counter() - self._started, 4),
+            'stageSeconds': {stage: round(seconds, 4) for stage, seconds in self.stage_seconds.items()},
+            'statements': dict(sorted(self.statements.items())),
+            'counters': dict(sorted(self.counters.items())),
+            **extra,
+        }
+
+    def report(self, destination, **extra):
+        # destination '-' prints to stderr (stdout keeps the usual messages),
+        # anything else is a file path
+        payload = json.dumps(self.summary(**extra), indent=2)
+        if destination == '-':
+            sys.stderr.write(payload + "\n")
+        else:
+            with open(destination, 'w', encoding='utf-8') as f:
+                f.write(payload + "\n")
+
+
+NULL_STATS = Stats(enabled=False)
@@ -0,0 +1,162 @@
+"""Checks run on each question block as it is scanned, with line numbers and an error budget."""
+
+import re
+from dataclasses import dataclass
+
+# Problems tolerated (and reported) before the scan is aborted
+DEFAULT_MAX_ERRORS = 0
+MIN_OPTIONS = 3
+# Option letters the banks use; the scanner reads any capital letter
+OPTION_LETTERS = frozenset("ABC")
+# The longest texts in the current banks are about a third of these
+MAX_PROMPT_CHARS = 200
+MAX_CONTEXT_CHARS = 240
+MAX_OPTION_CHARS = 120
+
+SPACE_RE = re.compile(r"\s+")
+# Distinct option tuples whose checks are remembered
+OPTION_CHECK_CACHE_SIZE = 1 << 14
+# Problems listed in the ValidationError message; the rest are summarized
+MESSAGE_ISSUES = 20
+
+
+@dataclass(slots=True, frozen=True)
+class Issue:
+    path: str
+    line: int
+    code: str
+    message: str
+
+    def __str__(self):
+        return f"{self.path}:{self.line}: {self.message} [{self.code}]"
+
+
+class ValidationError(ValueError):
+    def __init__(self, issues, max_errors):
+        self.issues = issues
+        shown = "\n".join(str(issue) for issue in issues[:MESSAGE_ISSUES])
+        more = f"\n... and {len(issues) - MESSAGE_ISSUES} more" if len(issues) > MESSAGE_ISSUES else ""
+        super().__init__(f"Question bank has more than {max_errors} problems, stopped at:\n{shown}{more}")
+
+
+class Validator:
+    # Passed to seedlib.scan.scan_questions, which calls check() for every
+    # block and stray() for every run of text outside one. Issues are kept
+    # with line numbers; the one that goes over `max_errors` raises
+    # ValidationError straight out of the scan, so nothing past it is rendered.
+    def __init__(
+        self,
+        max_errors=DEFAULT_MAX_ERRORS,
+        min_options=MIN_OPTIONS,
+        max_prompt_chars=MAX_PROMPT_CHARS,
+        max_context_chars=MAX_CONTEXT_CHARS,
+        max_option_chars=MAX_OPTION_CHARS,
+    ):
+        self.max_errors = max_errors
+        self.min_options = min_options
+        self.max_prompt_chars = max_prompt_chars
+        self.max_context_chars = max_context_chars
+        self.max_option_chars = max_option_chars
+        self.issues = []
+        self.checked = 0
+        self._data = None
+        self._option_checks = {}
+
+    def begin(self, data, path):
+        # Called by the scanner once the file is mapped. Numbering restarts
+        # per file; a byte range starting mid-file takes its first number as given.
+        self._data = data
+        self._path = path
+        self._line_offset = 0
+        self._line = 1
+        self._previous_number = None
+
+    def _line_at(self, offset):
+        # Newlines are only counted up to the next issue, and each stretch
+        # of the file only once, since the scanner moves forward
+        if offset < self._line_offset:
+            self._line_offset, self._line = 0, 1
+        self._line += self._data[self._line_offset:offset].count(b"\n")
+        self._line_offset = offset
+        return self._line
+
+    def _add(self, offset, code, message):
+        self.issues.append(Issue(self._path, self._line_at(offset), code, message))
+        if len(self.issues) > self.max_errors:
+            raise ValidationError(self.issues, self.max_errors)
+
+    def stray(self, offset):
+        end = self._data.find(b"\n", offset)
+        line = self._data[offset:end if end != -1 else len(self._data)].decode('utf-8', 'replace').strip()
+        self._add(offset, 'unparsed-text', f"Text outside any question block: {line[:60]!r}")
+
+    def _check_options(self, options):
+        # The scanner hands out one shared tuple per distinct option block, so
+        # results are cached by identity (holding the tuple keeps its id unique)
+        cached = self._option_checks.get(id(options))
+        if cached is not None:
+            return cached[1], cached[2]
+        problems = []
+        seen_ids = set()
+        seen_texts = {}
+        if len(options) < self.min_options:
+            problems.append(('option-count', f"has {len(options)} options (at least {self.min_options} needed)"))
+        for option in options:
+            if option.id not in OPTION_LETTERS:
+                problems.append(('option-letter', f"has option {option.id} (options are A-C)"))
+            if option.id in seen_ids:
+                problems.append(('duplicate-option', f"lists option {option.id} twice"))
+            seen_ids.add(option.id)
+            if not option.text:
+                problems.append(('empty-text', f"option {option.id} is empty"))
+                continue
+            if len(option.text) > self.max_option_chars:
+                problems.append(('too-long', f"option {option.id} is {len(option.text)} characters (limit {self.max_option_chars})"))
+            text = SPACE_RE.sub(" ", option.text).strip().casefold()
+            if text in seen_texts:
+                problems.append(('duplicate-option', f"options {seen_texts[text]} and {option.id} have the same text"))
+            else:
+                seen_texts[text] = option.id
+        if len(self._option_checks) >= OPTION_CHECK_CACHE_SIZE:
+            self._option_checks.clear()
+        self._option_checks[id(options)] = (options, seen_ids, problems)
+        return seen_ids, problems
+
+    def check(self, match, question):
+        # `match` is the scanner's block match; issues point at the
+        # "Question N:" line
+        self.checked += 1
+        number = question.number
+        problems = []
+
+        previous = self._previous_number
+        self._previous_number = number
+        if previous is not None and number != previous + 1:
+            problems.append(('numbering', f"Question {number} follows Question {previous}"))
+
+        if not question.prompt:
+            problems.append(('empty-text', f"Question {number} has no prompt"))
+        elif len(question.prompt) > self.max_prompt_chars:
+            problems.append(('too-long', f"Question {number} prompt is {len(question.prompt)} characters (limit {self.max_prompt_chars})"))
+        if len(question.context) > self.max_context_chars:
+            problems.append(('too-long', f"Question {number} context is {len(question.context)} characters (limit {self.max_context_chars})"))
+
+        option_ids, option_problems = self._check_options(question.options)
+        if option_problems:
+            problems.extend((code, f"Question {number} {message}") for code, message in option_problems)
+
+        if not question.answer:
+            problems.append(('missing-answer', f"Question {number} has no Answer: line"))
+        elif question.answer not in option_ids:
+            problems.append(('missing-answer', f"Question {number} answer {question.answer} is not one of its options"))
+
+        if problems:
+            offset = match.start('number')
+            for code, message in problems:
+                self._add(offset, code, message)
+
+    def summary(self):
+        counts = {}
+        for issue in self.issues:
+            counts[issue.code] = counts.get(issue.code, 0) + 1
+        return {'checked': self.checked, 'issues': len(self.issues), 'byCode': counts}
@@ -0,0 +1,102 @@
+"""Streaming writer for generated SQL, with optional gzip compression."""
+
+import gzip
+import io
+import os
+
+from .stats import NULL_STATS
+
+# Large buffer so many small statements turn into few write syscalls
+BUFFER_BYTES = 1 << 20
+
+
+def write_atomic(path, data):
+    # Write `data` (bytes) to "<path>.tmp" and rename it over `path`, so readers
+    # see the old file or the new one, never a partial write
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SqlWriter:
+    # Writes SQL fragments straight to disk as they are produced. Paths ending
+    # in ".gz" are gzip-compressed on the fly; the gzip header carries no
+    # timestamp so the same input always produces the same file. Output goes
+    # to "<path>.tmp" and replaces `path` on close, so a run that fails
+    # halfway leaves the previous file in place.
+    def __init__(self, path, compresslevel=6):
+        self.path = path
+        self.compressed = path.endswith('.gz')
+        self.fragments = 0
+        self.chars = 0
+        self._final_bytes = None
+        self._tmp_path = f"{path}.tmp"
+        self._raw = open(self._tmp_path, 'wb', buffering=BUFFER_BYTES)
+        if self.compressed:
+            self._gzip = gzip.GzipFile(filename='', mode='wb', fileobj=self._raw, compresslevel=compresslevel, mtime=0)
+            self._text = io.TextIOWrapper(self._gzip, encoding='utf-8')
+        else:
+            self._gzip = None
+            self._text = io.TextIOWrapper(self._raw, encoding='utf-8')
+
+    def write(self, fragment):
+        self._text.write(fragment)
+        self.fragments += 1
+        self.chars += len(fragment)
+
+    def write_all(self, fragments):
+        for fragment in fragments:
+            self.write(fragment)
+
+    @property
+    def bytes_written(self):
+        # Bytes on disk (compressed size for .gz outputs). Exact once the writer
+        # is closed; while open, compressed output may still sit in zlib's buffer.
+        if self._final_bytes is not None:
+            return self._final_bytes
+        self._text.flush()
+        return self._raw.tell()
+
+    def close(self):
+        if self._final_bytes is not None:
+            return
+        if self._gzip is not None:
+            # Closing the wrapper finishes the gzip stream but leaves our file open
+            self._text.close()
+            self._final_bytes = self._raw.tell()
+            self._raw.close()
+        else:
+            self._text.flush()
+            self._final_bytes = self._raw.tell()
+            self._text.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self):
+        # Drop the partial output; `path` keeps whatever it held before
+        if self._final_bytes is not None:
+            return
+        self._final_bytes = 0
+        self._text.close()
+        self._raw.close()
+        os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+        return False
+
+
+def write_sql(path, fragments, stats=NULL_STATS):
+    # Time spent producing fragments is charged to "render", writing them to "write"
+    with SqlWriter(path) as writer:
+        for fragment in stats.timed('render', fragments):
+            with stats.stage('write'):
+                writer.write(fragment)
+            stats.count_statements(fragment)
+    return writer
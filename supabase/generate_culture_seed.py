@@ -1,110 +1,26 @@
-import json
-import re
-
-def escape_sql_string(s):
-    if s is None:
-        return 'NULL'
-    # Escape single quotes by doubling them
-    return "'" + s.replace("'", "''") + "'"
-
-def main():
-    with open('raw_culture_questions.txt', 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Split content by question blocks (separated by blank lines, but we have a pattern)
-    # The pattern is roughly:
-    # - Context text
-    #   Question X: ...
-    #   A. ...
-    #   B. ...
-    #   C. ...
-    #   Answer: ...
-
-    # We can split by lines and process statefully
-    lines = [l.strip() for l in content.splitlines() if l.strip()]
-    
-    questions = []
-    current_q = {}
-    
-    # Simple state machine
-    # States: EXPECT_CONTEXT, EXPECT_QUESTION, EXPECT_OPTIONS, EXPECT_ANSWER
-    
-    # Actually, the file format is consistent.
-    # It starts with a line starting with "- " which is the context.
-    # Or sometimes the context is just the line before "Question X".
-    
-    # Let's iterate through lines look for "- " start or "Question X"
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Check for context (starts with "- ")
-        if line.startswith("- "):
-            context = line[2:] # Strip "- "
-            i += 1
-            if i >= len(lines): break
-            line = lines[i]
-        else:
-            # Maybe context was missing or formatted differently?
-            # From the input file provided, it seems consistent: "- Context"
-            context = ""
-
-        # Check for Question Text
-        # Format: "Question N: Text"
-        match_q = re.match(r"Question \d+: (.*)", line)
-        if match_q:
-            question_text = match_q.group(1)
-            # Combine context and question text
-            full_question_text = f"{context}\n\n{question_text}" if context else question_text
-            i += 1
-        else:
-            # Skip if we can't find a question
-            i += 1
-            continue
-            
-        # Get Options
-        options = []
-        # We expect A, B, C
-        while i < len(lines):
-            opt_line = lines[i]
-            match_opt = re.match(r"([A-C])\. (.*)", opt_line)
-            if match_opt:
-                oid = match_opt.group(1)
-                otext = match_opt.group(2)
-                options.append({"id": oid, "text": otext})
-                i += 1
-            else:
-                break
-                
-        # Get Answer
-        answer_key = ""
-        if i < len(lines):
-            ans_line = lines[i]
-            match_ans = re.match(r"Answer: ([A-C])", ans_line)
-            if match_ans:
-                answer_key = match_ans.group(1)
-                i += 1
-        
-        # Build Item
-        # Construct options JSON
-        options_json_struct = []
-        for opt in options:
-            options_json_struct.append({
-                "id": opt['id'],
-                "text": opt['text'],
-                "is_correct": (opt['id'] == answer_key)
-            })
-            
-        questions.append({
-            "text": full_question_text,
-            "options": json.dumps(options_json_struct)
-        })
-
-    # Generate SQL
-    # We need to split into 10 lessons (20 items each)
-    
-    sql_header = """-- CULTURE CONTENT EXPANSION V5 (User Context)
+import argparse
+import collections
+import itertools
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'scripts'))
+
+from seedlib.dedupe import NearDuplicateIndex  # noqa: E402
+from seedlib.delta import content_hash, is_unchanged, load_manifest, promote_manifest, removed_keys, row_id, save_pending_manifest  # noqa: E402
+from seedlib.encode import options_encoder  # noqa: E402
+from seedlib.ingest import REPO_ROOT, ingest, resolve_sources  # noqa: E402
+from seedlib.load import DEFAULT_UNITS_PER_TRANSACTION, DEFAULT_WORKERS, Loader, insert_sql  # noqa: E402
+from seedlib.scan import LAYOUTS, count_questions, scan_questions  # noqa: E402
+from seedlib.shardset import ShardSetWriter  # noqa: E402
+from seedlib.shard import DEFAULT_LESSON_SIZE, DEFAULT_LESSONS_PER_LEVEL, DEFAULT_ORDER_START, ShardPlan, balance_by_topic, question_topic  # noqa: E402
+from seedlib.sql import COPY_END, copy_header, copy_row, escape_sql_string, upsert_statement, uuid_array  # noqa: E402
+from seedlib.stats import NULL_STATS, Stats  # noqa: E402
+from seedlib.validate import DEFAULT_MAX_ERRORS, ValidationError, Validator  # noqa: E402
+from seedlib.writer import write_sql  # noqa: E402
+
+SQL_HEADER = """-- CULTURE CONTENT EXPANSION V5 (User Context)
 DO $$
 DECLARE
     japan_id UUID;
@@ -117,65 +33,741 @@ BEGIN
     SELECT id INTO v1_id FROM public.country_versions WHERE country_id = japan_id AND version_number = 1;
     SELECT id INTO tourist_branch_id FROM public.branches WHERE country_version_id = v1_id AND name = 'Tourist Essentials';
 
-    -- CLEANUP: Delete levels created by previous expansions (indices > 10) if any, or we can just append
-    -- Strategy: We will replace content if it exists or create new.
-    -- For simplicity, let's just delete the specific levels we are about to create if they exist by title?
-    -- Actually, safest is to remove old ones derived from previous seeds if they clash.
-    -- The previous v4 seed used indices 11-20 (10+1 to 10+10).
-    -- We will reuse that range 11-20.
-    
-    DELETE FROM public.levels WHERE branch_id = tourist_branch_id AND order_index > 10 AND order_index <= 20;
+    -- CLEANUP: this seed owns order_index {order_first}-{order_high} in the branch (--order-start / --order-end);
+    -- clear it so levels from an earlier run, or an earlier seed in the same range, are replaced.
+    DELETE FROM public.levels WHERE branch_id = tourist_branch_id AND order_index > {order_low} AND order_index <= {order_high};
 
 """
 
-    sql_body = ""
-    
-    total_questions = len(questions)
-    chunk_size = 20
-    
-    for lesson_idx in range(10): # 10 Lessons
-        start_idx = lesson_idx * chunk_size
-        end_idx = start_idx + chunk_size
-        lesson_questions = questions[start_idx:end_idx]
-        
-        if not lesson_questions:
-            break
-            
-        lesson_num = lesson_idx + 1
-        
-        sql_body += f"""
-    -- Tourist Lesson {lesson_num} (Questions {start_idx+1}-{min(end_idx, total_questions)})
-    INSERT INTO public.levels (branch_id, title, description, order_index, difficulty_level)
-    VALUES (tourist_branch_id, 'Culture Level {lesson_num}', 'Japanese Manners & Customs {lesson_num}', 10 + {lesson_num}, 1) RETURNING id INTO level_id;
-
-    INSERT INTO public.lessons (level_id, title, description, order_index)
-    VALUES (level_id, 'Culture Lesson {lesson_num}', 'Japanese Etiquette {lesson_num}', 10 + {lesson_num}) RETURNING id INTO lesson_id;
-
-    -- Intro
+SQL_FOOTER = "END $$;"
+
+TOURIST_BRANCH_SQL = """SELECT b.id
+    FROM public.branches b
+    JOIN public.country_versions v ON v.id = b.country_version_id AND v.version_number = 1
+    JOIN public.countries c ON c.id = v.country_id AND c.code = 'JP'
+    WHERE b.name = 'Tourist Essentials'"""
+
+COPY_HEADER = f"""-- CULTURE CONTENT EXPANSION V5 (User Context, COPY format)
+-- Apply with psql: COPY ... FROM STDIN sections need a client that streams them.
+BEGIN;
+
+-- Levels need the branch id, which only exists in the target database, so they
+-- go through a small staging table. Lessons and activities link to the ids
+-- generated here and are copied straight into their tables.
+CREATE TEMP TABLE seed_levels (
+    id UUID,
+    title TEXT,
+    description TEXT,
+    order_index INT,
+    difficulty_level INT
+) ON COMMIT DROP;
+
+DELETE FROM public.levels
+WHERE branch_id = ({TOURIST_BRANCH_SQL})
+AND order_index > {{order_low}} AND order_index <= {{order_high}};
+
+"""
+
+LEVEL_COLUMNS = ('id', 'title', 'description', 'order_index', 'difficulty_level')
+LESSON_COLUMNS = ('id', 'level_id', 'title', 'description', 'order_index')
+ACTIVITY_COLUMNS = ('id', 'lesson_id', 'type', 'question_text', 'options', 'order_index')
+
+LOAD_LEVEL_SQL = insert_sql('public.levels', ('id', 'branch_id') + LEVEL_COLUMNS[1:])
+LOAD_LESSON_SQL = insert_sql('public.lessons', LESSON_COLUMNS)
+LOAD_ACTIVITY_SQL = insert_sql('public.activities', ACTIVITY_COLUMNS, casts={'options': 'jsonb'})
+
+# Activity rows are spooled to disk past this size so COPY output stays bounded in memory
+COPY_SPOOL_BYTES = 1 << 20
+
+# Opens a DO block with the branch id in tourist_branch_id; close with SQL_FOOTER
+BRANCH_BLOCK = """DO $$
+DECLARE
+    tourist_branch_id UUID;
+BEGIN
+    SELECT b.id INTO tourist_branch_id
+    FROM public.branches b
+    JOIN public.country_versions v ON v.id = b.country_version_id AND v.version_number = 1
+    JOIN public.countries c ON c.id = v.country_id AND c.code = 'JP'
+    WHERE b.name = 'Tourist Essentials';
+"""
+
+DELTA_HEADER = """-- CULTURE CONTENT EXPANSION V5 (User Context, delta)
+-- Only lessons whose content hash changed since the last manifest are written.
+""" + BRANCH_BLOCK
+
+SHARD_HEADER = """-- CULTURE CONTENT EXPANSION V5 (User Context, shard {name})
+-- Apply after the shards listed for it in manifest.json; re-applying is safe.
+""" + BRANCH_BLOCK
+
+SHARD_BY = ('level', 'lesson')
+
+DEFAULT_OUTPUT = 'seed_content_culture_v5.sql'
+DEFAULT_SHARD_DIR = 'seed_content_culture_v5.shards'
+
+
+def render_lesson(shard, activity_batch_size=0, stats=NULL_STATS):
+    # Yield the SQL fragments for one lesson (level if it opens one + lesson + intro + questions)
+    lesson_num = shard.lesson_num
+    lesson_questions = shard.questions
+    yield f"""
+    -- Tourist Lesson {lesson_num} (Questions {shard.start_idx+1}-{shard.start_idx + len(lesson_questions)})
+"""
+    if shard.first_in_level:
+        yield f"""    INSERT INTO public.levels (branch_id, title, description, order_index, difficulty_level)
+    VALUES (tourist_branch_id, 'Culture Level {shard.level_num}', 'Japanese Manners & Customs {shard.level_num}', {shard.order_start} + {shard.level_num}, 1) RETURNING id INTO level_id;
+
+"""
+    yield f"""    INSERT INTO public.lessons (level_id, title, description, order_index)
+    VALUES (level_id, 'Culture Lesson {lesson_num}', 'Japanese Etiquette {lesson_num}', {shard.order_start} + {lesson_num}) RETURNING id INTO lesson_id;
+
+"""
+
+    intro_row = f"(lesson_id, 'info', 'Welcome to Culture Lesson {lesson_num}! Master these scenarios.', null, 1)"
+    question_rows = (
+        # Start at 2 because 1 is intro
+        f"(lesson_id, 'multiple_choice', {escape_sql_string(q.text)}, {encode_options(q, stats, sql=True)}::jsonb, {q_idx + 2})"
+        for q_idx, q in enumerate(lesson_questions)
+    )
+
+    if activity_batch_size > 0:
+        yield from render_activity_batches(itertools.chain([intro_row], question_rows), activity_batch_size)
+    else:
+        yield f"""    -- Intro
     INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES
-    (lesson_id, 'info', 'Welcome to Culture Lesson {lesson_num}! Master these scenarios.', null, 1);
+    {intro_row};
     
 """
-        
-        for q_idx, q in enumerate(lesson_questions):
-            q_text_esc = escape_sql_string(q['text'])
-            opts_esc = escape_sql_string(q['options'])
-            order_index = q_idx + 2 # Start at 2 because 1 is intro
-            
-            sql_body += f"""    INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES
-    (lesson_id, 'multiple_choice', {q_text_esc}, {opts_esc}::jsonb, {order_index});
+        for row in question_rows:
+            yield f"""    INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES
+    {row};
 """
-        
-        sql_body += "\n"
 
-    sql_footer = "END $$;"
-    
-    full_sql = sql_header + sql_body + sql_footer
-    
-    with open('seed_content_culture_v5.sql', 'w', encoding='utf-8') as f:
-        f.write(full_sql)
+    yield "\n"
+
+
+def render_activity_batches(rows, batch_size):
+    # One multi-row VALUES list per lesson, split every `batch_size` rows so a
+    # single statement never grows without bound
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+        values = ",\n    ".join(batch)
+        yield f"""    INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES
+    {values};
+"""
+
+
+def encode_options(question, stats, sql=False):
+    # JSON (or its escaped SQL literal) from the shared cache; most questions
+    # reuse an option set that was already encoded
+    with stats.stage('encode'):
+        return options_encoder.sql(question) if sql else options_encoder.json(question)
+
+
+def build_lesson(shard, stats=NULL_STATS):
+    # Rows for one lesson with deterministic ids, plus the hash of everything
+    # that ends up in the database for it
+    lesson_num = shard.lesson_num
+    level_id = row_id('culture', 'level', shard.level_num)
+    lesson_id = row_id('culture', 'lesson', lesson_num)
+
+    activities = [(
+        row_id('culture', 'activity', lesson_num, 1), 'info',
+        f'Welcome to Culture Lesson {lesson_num}! Master these scenarios.', None, 1,
+    )]
+    for q_idx, q in enumerate(shard.questions):
+        order = q_idx + 2 # Start at 2 because 1 is intro
+        activities.append((row_id('culture', 'activity', lesson_num, order), 'multiple_choice', q.text, encode_options(q, stats), order))
+
+    level = (level_id, f'Culture Level {shard.level_num}', f'Japanese Manners & Customs {shard.level_num}', shard.level_order, 1)
+    lesson = (lesson_id, level_id, f'Culture Lesson {lesson_num}', f'Japanese Etiquette {lesson_num}', shard.lesson_order)
+    return {
+        'key': f'lesson-{lesson_num}',
+        'level': level,
+        'lesson': lesson,
+        'activities': activities,
+        'hash': content_hash([level, lesson, activities]),
+    }
+
+
+def lesson_id_for_key(key):
+    # Row id of the lesson build_lesson keyed `key` ("lesson-<n>")
+    return row_id('culture', 'lesson', int(key.rsplit('-', 1)[1]))
+
+
+def render_seed(questions, plan, activity_batch_size=0, stats=NULL_STATS):
+    order_low, order_high = plan.clear_range
+    yield SQL_HEADER.format(order_low=order_low, order_first=order_low + 1, order_high=order_high)
+
+    for shard in plan.shards(questions):
+        yield from render_lesson(shard, activity_batch_size, stats)
+
+    yield SQL_FOOTER
+
+
+def render_copy_seed(questions, plan, stats=NULL_STATS):
+    # COPY sections have to arrive parent-first (levels, lessons, activities),
+    # but activities are only known as the question stream is read. Level and
+    # lesson rows are a couple per lesson, so they are kept in memory; activity
+    # rows are spooled to a temporary file and replayed at the end.
+    level_rows = []
+    lesson_rows = []
+
+    with tempfile.SpooledTemporaryFile(max_size=COPY_SPOOL_BYTES, mode='w+', encoding='utf-8') as spool:
+        for shard in plan.shards(questions):
+            built = build_lesson(shard, stats)
+            lesson_id = built['lesson'][0]
+            if shard.first_in_level:
+                level_rows.append(copy_row(*built['level']))
+            lesson_rows.append(copy_row(*built['lesson']))
+            for activity in built['activities']:
+                spool.write(copy_row(activity[0], lesson_id, *activity[1:]))
+            stats.count('copy.rows', shard.first_in_level + 1 + len(built['activities']))
+
+        order_low, order_high = plan.clear_range
+        yield COPY_HEADER.format(order_low=order_low, order_high=order_high)
+
+        yield copy_header('seed_levels', LEVEL_COLUMNS)
+        yield from level_rows
+        yield COPY_END
+        yield f"""
+INSERT INTO public.levels (id, branch_id, title, description, order_index, difficulty_level)
+SELECT s.id, branch.id, s.title, s.description, s.order_index, s.difficulty_level
+FROM seed_levels s
+CROSS JOIN ({TOURIST_BRANCH_SQL}) branch;
+
+"""
+
+        yield copy_header('public.lessons', LESSON_COLUMNS)
+        yield from lesson_rows
+        yield COPY_END
+        yield "\n"
+
+        yield copy_header('public.activities', ACTIVITY_COLUMNS)
+        spool.seek(0)
+        while True:
+            chunk = spool.read(64 * 1024)
+            if not chunk:
+                break
+            yield chunk
+        yield COPY_END
+
+    yield "\nCOMMIT;\n"
+
+
+def render_lesson_upsert(built, label='changed'):
+    level_id, title, description, order_index, difficulty = built['level']
+    lesson_id = built['lesson'][0]
+    activity_ids = [a[0] for a in built['activities']]
+
+    yield f"\n    -- {built['key']} ({label})\n"
+    yield upsert_statement(
+        'public.levels',
+        ('id', 'branch_id', 'title', 'description', 'order_index', 'difficulty_level'),
+        [[f"'{level_id}'", 'tourist_branch_id', escape_sql_string(title), escape_sql_string(description), str(order_index), str(difficulty)]],
+        indent="    ",
+    )
+    yield upsert_statement(
+        'public.lessons',
+        LESSON_COLUMNS,
+        [[f"'{lesson_id}'", f"'{level_id}'", escape_sql_string(built['lesson'][2]), escape_sql_string(built['lesson'][3]), str(built['lesson'][4])]],
+        indent="    ",
+    )
+    # Drop activities that no longer exist in this lesson before upserting the current ones
+    yield f"    DELETE FROM public.activities WHERE lesson_id = '{lesson_id}' AND id <> ALL({uuid_array(activity_ids)});\n"
+    yield upsert_statement(
+        'public.activities',
+        ACTIVITY_COLUMNS,
+        [
+            [f"'{activity_id}'", f"'{lesson_id}'", escape_sql_string(kind), escape_sql_string(text),
+             escape_sql_string(options) + '::jsonb' if options is not None else 'null', str(order)]
+            for activity_id, kind, text, options, order in built['activities']
+        ],
+        indent="    ",
+    )
+
+
+def render_delta_seed(questions, plan, previous, manifest, stats=NULL_STATS):
+    # `previous` is the last applied manifest; `manifest` is filled in with the
+    # entries for this run so the caller can save it once the SQL is written.
+    yield DELTA_HEADER
+
+    for shard in plan.shards(questions):
+        built = build_lesson(shard, stats)
+        entry = {
+            'hash': built['hash'],
+            'level_id': built['level'][0],
+            'lesson_id': built['lesson'][0],
+            'activity_ids': [a[0] for a in built['activities']],
+        }
+        manifest[built['key']] = entry
+        if not is_unchanged(previous, built['key'], entry):
+            yield from render_lesson_upsert(built)
+
+    current_levels = dict.fromkeys(entry['level_id'] for entry in manifest.values())
+    # Levels no longer used by any lesson, e.g. after fewer questions or a new --lessons-per-level
+    stale_levels = dict.fromkeys(
+        entry['level_id'] for entry in previous.values() if entry['level_id'] not in current_levels
+    )
+    for key in removed_keys(previous, manifest):
+        yield f"\n    -- {key} (removed)\n"
+        level_id = previous[key]['level_id']
+        if level_id in current_levels:
+            # The level still holds other lessons; deleting the lesson cascades to its activities
+            yield f"    DELETE FROM public.lessons WHERE id = '{previous[key]['lesson_id']}';\n"
+        elif stale_levels.pop(level_id, False) is None:
+            # Deleting the level cascades to its lessons and activities
+            yield f"    DELETE FROM public.levels WHERE id = '{level_id}';\n"
+    for level_id in stale_levels:
+        # Its lessons were upserted into other levels above
+        yield f"\n    -- level {level_id} (no longer used)\n"
+        yield f"    DELETE FROM public.levels WHERE id = '{level_id}';\n"
+
+    if not previous:
+        # First delta run: clear rows left behind by earlier non-deterministic seeds in the range
+        order_low, order_high = plan.clear_range
+        yield f"\n    -- Bootstrap: remove legacy levels in the {order_low + 1}-{order_high} range not owned by this seed\n"
+        yield (
+            f"    DELETE FROM public.levels WHERE branch_id = tourist_branch_id AND order_index > {order_low} AND order_index <= {order_high}"
+            f" AND id <> ALL({uuid_array(current_levels)});\n"
+        )
+
+    yield "\n" + SQL_FOOTER + "\n"
+
+
+def write_shards(questions, plan, shard_set, shard_by='level', stats=NULL_STATS):
+    # One file per level (or lesson) holding idempotent upserts of its rows, so
+    # shards apply in any order, in parallel, and can be re-run after a
+    # failure. A "prepare" shard, which every other shard depends on, clears
+    # rows in the seed's range, and rows the previous manifest in the
+    # directory listed, that this run no longer writes; it is written last,
+    # once every id is known, but listed first in the manifest.
+    level_ids = {}
+    lesson_ids = []
+    lesson_keys = set()
+    group_key = (lambda shard: shard.level_num) if shard_by == 'level' else (lambda shard: shard.lesson_num)
+    for number, shards in itertools.groupby(plan.shards(questions), key=group_key):
+        name = f'{shard_by}-{number}'
+        built = [build_lesson(shard, stats) for shard in shards]
+        fragments = [SHARD_HEADER.format(name=name)]
+        for lesson in built:
+            level_ids[lesson['level'][0]] = None
+            lesson_ids.append(lesson['lesson'][0])
+            lesson_keys.add(lesson['key'])
+            fragments.extend(render_lesson_upsert(lesson, label='upsert'))
+        fragments.append("\n" + SQL_FOOTER + "\n")
+        with stats.stage('write'):
+            shard_set.add(
+                name,
+                fragments,
+                depends_on=('prepare',),
+                lessons=[lesson['key'] for lesson in built],
+                activities=sum(len(lesson['activities']) for lesson in built),
+            )
+        stats.count('shards.written')
+
+    # Read (and so validate) the rest of the bank, e.g. past --max-lessons,
+    # before the manifest is rewritten
+    for _ in questions:
+        pass
+
+    order_low, order_high = plan.clear_range
+    prepare = [
+        SHARD_HEADER.format(name='prepare'),
+        f"\n    -- Levels in the {order_low + 1}-{order_high} range, and lessons in this seed's levels, that this run does not write\n",
+        f"    DELETE FROM public.levels WHERE branch_id = tourist_branch_id AND order_index > {order_low} AND order_index <= {order_high}"
+        f" AND id <> ALL({uuid_array(level_ids)});\n",
+        f"    DELETE FROM public.lessons WHERE level_id = ANY({uuid_array(level_ids)}) AND id <> ALL({uuid_array(lesson_ids)});\n",
+    ]
+    previous = shard_set.previous
+    if previous:
+        # The previous run may have owned a different range (another
+        # --order-start/--order-end) or lessons this one no longer writes
+        previous_low, previous_high = previous['orderRange']
+        if previous_low <= order_low or previous_high > order_high:
+            prepare.append(f"\n    -- Levels in the {previous_low}-{previous_high} range of the previous shards that this run does not write\n")
+            prepare.append(
+                f"    DELETE FROM public.levels WHERE branch_id = tourist_branch_id AND order_index >= {previous_low} AND order_index <= {previous_high}"
+                f" AND id <> ALL({uuid_array(level_ids)});\n"
+            )
+        stale_lessons = [
+            lesson_id_for_key(key)
+            for shard in previous['shards'] for key in shard.get('lessons', ())
+            if key not in lesson_keys
+        ]
+        if stale_lessons:
+            prepare.append("\n    -- Lessons of the previous shards that this run does not write\n")
+            prepare.append(f"    DELETE FROM public.lessons WHERE id = ANY({uuid_array(stale_lessons)});\n")
+    prepare.append("\n" + SQL_FOOTER + "\n")
+    with stats.stage('write'):
+        shard_set.add('prepare', prepare, position=0)
+    stats.count('shards.written')
+    return shard_set.finish()
+
+
+def iter_load_units(questions, plan, branch_id, stats=NULL_STATS):
+    # One unit per level: the level, its lessons and their activities have to
+    # commit together, since lessons reference the level row
+    for _, shards in itertools.groupby(plan.shards(questions), key=lambda shard: shard.level_num):
+        levels, lessons, activities = [], [], []
+        for shard in shards:
+            built = build_lesson(shard, stats)
+            lesson_id = built['lesson'][0]
+            if shard.first_in_level:
+                level_id, *level_values = built['level']
+                levels.append((level_id, branch_id, *level_values))
+            lessons.append(built['lesson'])
+            activities.extend((activity[0], lesson_id, *activity[1:]) for activity in built['activities'])
+        yield [(LOAD_LEVEL_SQL, levels), (LOAD_LESSON_SQL, lessons), (LOAD_ACTIVITY_SQL, activities)]
+
+
+def load_seed(questions, plan, loader, stats=NULL_STATS):
+    # Same rows as the copy format, inserted straight into the database: clear
+    # the seed's order_index range, then load levels concurrently
+    rows = loader.execute(TOURIST_BRANCH_SQL)
+    if not rows:
+        raise SystemExit("Tourist Essentials branch (JP, version 1) not found; load the base seed first.")
+    branch_id = rows[0][0]
+
+    order_low, order_high = plan.clear_range
+    loader.execute(
+        "DELETE FROM public.levels WHERE branch_id = %s AND order_index > %s AND order_index <= %s",
+        (branch_id, order_low, order_high),
+    )
+
+    units = stats.timed('render', iter_load_units(questions, plan, branch_id, stats))
+    for counts in stats.timed('load', loader.load(units)):
+        stats.count('load.transactions')
+        stats.count('load.rows', sum(counts.values()))
+
+
+class Counter:
+    # Pass-through iterator that counts the items flowing through it
+    def __init__(self, iterable):
+        self._it = iter(iterable)
+        self.count = 0
+
+    def __iter__(self):
+        for item in self._it:
+            self.count += 1
+            yield item
+
+    def drain(self):
+        # Consume whatever the renderer left behind so the total reflects the whole file
+        for _ in self:
+            pass
+
+
+def build_dedupe_index(seed_path, stats=NULL_STATS):
+    # Index every other content source up front; the seed's own questions are
+    # added as they stream to the renderer
+    seed_path = os.path.abspath(seed_path)
+    others = [(kind, path) for kind, path in resolve_sources() if os.path.abspath(path) != seed_path]
+    index = NearDuplicateIndex()
+    with stats.stage('dedupe'):
+        for question in ingest(others, workers=1):
+            index.add(question)
+    return index
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the culture content seed SQL.")
+    parser.add_argument('--input', default='raw_culture_questions.txt', help="Question corpus to parse")
+    parser.add_argument(
+        '--layout',
+        choices=('auto',) + LAYOUTS,
+        default='auto',
+        help="Corpus layout: culture ('- context' / 'Question N:'), blocks ('----' separated, as in raw_questions.txt) or auto-detect",
+    )
+    parser.add_argument(
+        '--output',
+        help=f"SQL file to write, .sql.gz is gzip-compressed (default: {DEFAULT_OUTPUT}); "
+        f"with --format shards, the directory to write (default: {DEFAULT_SHARD_DIR})",
+    )
+    parser.add_argument(
+        '--format',
+        choices=('sql', 'copy', 'shards'),
+        default='sql',
+        help="sql: DO block of INSERT statements; copy: psql script of COPY ... FROM STDIN sections; "
+        "shards: one self-contained file per level or lesson plus a manifest",
+    )
+    parser.add_argument(
+        '--shard-by',
+        choices=SHARD_BY,
+        default='level',
+        help="Unit of one file with --format shards",
+    )
+    parser.add_argument(
+        '--activity-batch-size',
+        type=int,
+        default=0,
+        metavar='N',
+        help="Write activities as multi-row INSERTs of at most N rows per lesson (0 = one INSERT per activity)",
+    )
+    parser.add_argument(
+        '--delta',
+        action='store_true',
+        help="Only write upserts/deletes for lessons whose content hash differs from --manifest",
+    )
+    parser.add_argument(
+        '--manifest',
+        default='seed_content_culture_v5.manifest.json',
+        help="Per-lesson content hash manifest of what was last applied, read by --delta",
+    )
+    parser.add_argument(
+        '--mark-applied',
+        action='store_true',
+        help="Record the pending manifest of the last --delta run as applied, once its SQL has run, and exit",
+    )
+    parser.add_argument(
+        '--max-errors',
+        type=int,
+        default=DEFAULT_MAX_ERRORS,
+        metavar='N',
+        help="Problems in the question bank tolerated (and reported) before the run is aborted",
+    )
+    parser.add_argument(
+        '--no-validate',
+        action='store_true',
+        help="Skip the checks on each question block (answer, options, numbering, text length)",
+    )
+    parser.add_argument(
+        '--lesson-size',
+        type=int,
+        default=DEFAULT_LESSON_SIZE,
+        metavar='N',
+        help="Questions per lesson",
+    )
+    parser.add_argument(
+        '--lessons-per-level',
+        type=int,
+        default=DEFAULT_LESSONS_PER_LEVEL,
+        metavar='N',
+        help="Lessons grouped under each level",
+    )
+    parser.add_argument(
+        '--order-start',
+        type=int,
+        default=DEFAULT_ORDER_START,
+        metavar='N',
+        help="Levels take order_index N+1, N+2, ... in the Tourist Essentials branch; that range is cleared before inserting",
+    )
+    parser.add_argument(
+        '--order-end',
+        type=int,
+        metavar='N',
+        help="Clear order_index up to N even when this run writes fewer levels "
+        "(default: --order-start + 10); raise it to the highest level an earlier, larger run wrote",
+    )
+    parser.add_argument(
+        '--max-lessons',
+        type=int,
+        metavar='N',
+        help="Stop after N lessons (default: as many as the corpus needs)",
+    )
+    parser.add_argument(
+        '--balance-topics',
+        action='store_true',
+        help="Interleave questions round-robin by topic (inferred from the text as the app does) so each lesson mixes topics; "
+        "reads the whole corpus into memory",
+    )
+    parser.add_argument(
+        '--database-url',
+        metavar='URL',
+        help="Insert the content into this Postgres database instead of writing --output (needs psycopg 3)",
+    )
+    parser.add_argument(
+        '--load-workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        metavar='N',
+        help="Concurrent connections used with --database-url",
+    )
+    parser.add_argument(
+        '--levels-per-transaction',
+        type=int,
+        default=DEFAULT_UNITS_PER_TRANSACTION,
+        metavar='N',
+        help="Levels committed per transaction with --database-url",
+    )
+    parser.add_argument(
+        '--dedupe-report',
+        metavar='PATH',
+        help="Also write the near-duplicate check as a JSON report to PATH",
+    )
+    parser.add_argument(
+        '--no-dedupe',
+        action='store_true',
+        help="Skip checking the questions against every other content source for near-duplicates",
+    )
+    parser.add_argument(
+        '--stats',
+        nargs='?',
+        const='-',
+        metavar='PATH',
+        help="Write a JSON summary of stage timings and counters to PATH (stderr if omitted)",
+    )
+    args = parser.parse_args(argv)
+    if args.output is None:
+        args.output = DEFAULT_SHARD_DIR if args.format == 'shards' else DEFAULT_OUTPUT
+    if args.delta and args.format != 'sql':
+        parser.error("--delta only supports --format sql")
+    if args.activity_batch_size < 0:
+        parser.error("--activity-batch-size must be >= 0")
+    if args.activity_batch_size and args.format != 'sql':
+        parser.error("--activity-batch-size only applies to --format sql")
+    if args.lesson_size < 1 or args.lessons_per_level < 1:
+        parser.error("--lesson-size and --lessons-per-level must be >= 1")
+    if args.max_errors < 0:
+        parser.error("--max-errors must be >= 0")
+    if args.order_start < 0:
+        parser.error("--order-start must be >= 0")
+    if args.order_end is not None and args.order_end <= args.order_start:
+        parser.error("--order-end must be greater than --order-start")
+    if args.max_lessons is not None and args.max_lessons < 1:
+        parser.error("--max-lessons must be >= 1")
+    if args.database_url and (args.delta or args.format != 'sql' or args.activity_batch_size):
+        parser.error("--database-url cannot be combined with --delta, --format copy/shards or --activity-batch-size")
+    if args.no_dedupe and args.dedupe_report:
+        parser.error("--dedupe-report cannot be combined with --no-dedupe")
+    if args.load_workers < 1 or args.levels_per_transaction < 1:
+        parser.error("--load-workers and --levels-per-transaction must be >= 1")
+    return args
+
+
+def then_drain(fragments, questions):
+    # Read (and so validate) the rest of the bank, e.g. questions past
+    # --max-lessons, before the writer replaces the output
+    yield from fragments
+    questions.drain()
+
+
+def write_output(args, questions, plan, stats=NULL_STATS):
+    # Render (or load) in the selected format; returns (writer, shard_set),
+    # whichever the format used. `questions` is a Counter; every format reads
+    # it to the end before committing anything, except a database load,
+    # which commits level by level.
+    writer = None
+    shard_set = None
+    if args.database_url:
+        with Loader(args.database_url, args.load_workers, args.levels_per_transaction) as loader:
+            load_seed(questions, plan, loader, stats)
+    elif args.delta:
+        previous = load_manifest(args.manifest)
+        manifest = {}
+        writer = write_sql(args.output, then_drain(render_delta_seed(questions, plan, previous, manifest, stats), questions), stats)
+        pending = save_pending_manifest(args.manifest, 'generate_culture_seed', manifest)
+        changed = sum(1 for key, entry in manifest.items() if not is_unchanged(previous, key, entry))
+        print(
+            f"Delta: {changed} changed, {len(manifest) - changed} unchanged, "
+            f"{len(removed_keys(previous, manifest))} removed lessons."
+        )
+        print(f"Apply {args.output}, then run with --mark-applied to record {pending} as applied.")
+    elif args.format == 'copy':
+        writer = write_sql(args.output, then_drain(render_copy_seed(questions, plan, stats), questions), stats)
+    elif args.format == 'shards':
+        shard_set = ShardSetWriter(
+            args.output,
+            'generate_culture_seed',
+            shardBy=args.shard_by,
+            orderRange=[plan.clear_range[0] + 1, plan.clear_range[1]],
+        )
+        manifest, removed = write_shards(questions, plan, shard_set, args.shard_by, stats)
+        print(
+            f"Shards: {len(manifest['shards'])} files in {args.output} (one per {args.shard_by}, plus prepare)"
+            + (f", removed {len(removed)} outdated." if removed else ".")
+        )
+    else:
+        writer = write_sql(args.output, then_drain(render_seed(questions, plan, args.activity_batch_size, stats), questions), stats)
+    return writer, shard_set
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.mark_applied:
+        try:
+            promote_manifest(args.manifest)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        print(f"Recorded {args.manifest} as applied.")
+        return
+    stats = Stats() if args.stats else NULL_STATS
+    layout = None if args.layout == 'auto' else args.layout
+    parse_counts = stats.counters if stats.enabled else None
+    # Blocks are checked as they are scanned; going over --max-errors raises
+    # ValidationError out of whichever stage is pulling questions
+    validator = None if args.no_validate else Validator(args.max_errors)
+    # The corpus is memory-mapped, so reading it is charged to "parse"
+    source = os.path.relpath(os.path.abspath(args.input), REPO_ROOT)
+    questions = stats.timed('parse', scan_questions(args.input, layout, counts=parse_counts, source=source, validator=validator))
+    dedupe = None
+    if not args.no_dedupe:
+        dedupe = build_dedupe_index(args.input, stats)
+        questions = stats.timed('dedupe', dedupe.watch(questions))
+    try:
+        if args.balance_topics:
+            questions = balance_by_topic(questions)
+            total = len(questions)
+            topics = collections.Counter(question_topic(question) for question in questions)
+            print(f"Balanced across {len(topics)} topics: " + ", ".join(f"{topic} {count}" for topic, count in topics.most_common()))
+        else:
+            # Counting blocks first is a fast regex pass, and lets the header clear
+            # exactly the order_index range the lessons will use while the
+            # questions themselves are still streamed
+            with stats.stage('parse'):
+                total = count_questions(args.input, layout)
+        plan = ShardPlan(total, args.lesson_size, args.lessons_per_level, args.order_start, args.max_lessons, args.order_end)
+        questions = Counter(questions)
+        writer, shard_set = write_output(args, questions, plan, stats)
+        questions.drain()
+    except ValidationError as exc:
+        if args.database_url:
+            outcome = "Levels committed before the problem stay in the database."
+        elif args.format == 'shards':
+            outcome = f"The manifest in {args.output} was not updated; regenerate the shards before applying them."
+        else:
+            # write_sql only replaces the output once it is complete
+            outcome = f"{args.output} was left unchanged."
+        raise SystemExit(f"{exc}\n{outcome} Fix the bank or raise --max-errors.") from exc
 
-    print(f"Generated seed content with {len(questions)} questions.")
+    if validator is not None and validator.issues:
+        print(f"{len(validator.issues)} problems in {args.input} (within --max-errors {args.max_errors}):", file=sys.stderr)
+        for issue in validator.issues:
+            print(f"  {issue}", file=sys.stderr)
+    print(f"{'Loaded' if args.database_url else 'Generated'} seed content with {questions.count} questions.")
+    if dedupe is not None:
+        with stats.stage('dedupe'):
+            report = dedupe.write_report(args.dedupe_report) if args.dedupe_report else dedupe.report()
+        print(
+            f"Near-duplicates: {report['duplicateQuestions']} questions in {report['clusters']} clusters "
+            f"({report['crossSourceClusters']} across sources, {report['conflictingAnswers']} with conflicting answers)"
+            + (f" -> {args.dedupe_report}." if args.dedupe_report else "; --dedupe-report PATH lists them.")
+        )
+    order_low, order_high = plan.order_range
+    print(f"Lessons: {plan.lessons} across {plan.levels} levels (order_index {order_low + 1}-{order_high}).")
+    clear_high = plan.clear_range[1]
+    if clear_high > order_high:
+        print(f"Cleared order_index {order_low + 1}-{clear_high}; this run writes no levels at {order_high + 1}-{clear_high}.")
+    if plan.lessons * plan.lesson_size < questions.count:
+        print(f"Skipped {questions.count - plan.lessons * plan.lesson_size} questions past --max-lessons {plan.max_lessons}.")
+    if stats.enabled:
+        # The database URL may carry a password, so it is not echoed into the report
+        stats.report(
+            args.stats,
+            output='database' if args.database_url else args.output,
+            format='load' if args.database_url else 'delta' if args.delta else args.format,
+            questions=questions.count,
+            lessons=plan.lessons,
+            levels=plan.levels,
+            orderRange=[order_low + 1, order_high],
+            clearedRange=[order_low + 1, clear_high],
+            bytesEmitted=writer.bytes_written if writer else shard_set.bytes_written if shard_set else 0,
+            charsEmitted=writer.chars if writer else 0,
+            optionsCache=options_encoder.summary(),
+            validation=validator.summary() if validator is not None else None,
+        )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,31 @@
+-- Minimal stand-ins for the Supabase auth schema and roles, so schema.sql,
+-- the migrations and scripts/generate_telemetry_fixture.py output can be
+-- loaded into a plain local Postgres. Every statement is a no-op where the
+-- real objects exist (e.g. a Supabase project); never needed there.
+
+CREATE SCHEMA IF NOT EXISTS auth;
+
+CREATE TABLE IF NOT EXISTS auth.users (
+    id UUID PRIMARY KEY
+);
+
+DO $$
+BEGIN
+    -- auth.uid() reads the caller from the same setting Supabase uses, so
+    -- `SET request.jwt.claim.sub = '<profile id>'` acts as that user
+    IF to_regprocedure('auth.uid()') IS NULL THEN
+        CREATE FUNCTION auth.uid() RETURNS UUID
+        LANGUAGE sql STABLE
+        AS 'SELECT NULLIF(current_setting(''request.jwt.claim.sub'', true), '''')::UUID';
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+        CREATE ROLE anon NOLOGIN;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'authenticated') THEN
+        CREATE ROLE authenticated NOLOGIN;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'service_role') THEN
+        CREATE ROLE service_role NOLOGIN;
+    END IF;
+END $$;
@@ -11,13 +11,8 @@ BEGIN
     SELECT id INTO v1_id FROM public.country_versions WHERE country_id = japan_id AND version_number = 1;
     SELECT id INTO tourist_branch_id FROM public.branches WHERE country_version_id = v1_id AND name = 'Tourist Essentials';
 
-    -- CLEANUP: Delete levels created by previous expansions (indices > 10) if any, or we can just append
-    -- Strategy: We will replace content if it exists or create new.
-    -- For simplicity, let's just delete the specific levels we are about to create if they exist by title?
-    -- Actually, safest is to remove old ones derived from previous seeds if they clash.
-    -- The previous v4 seed used indices 11-20 (10+1 to 10+10).
-    -- We will reuse that range 11-20.
-    
+    -- CLEANUP: this seed owns order_index 11-20 in the branch (--order-start / --order-end);
+    -- clear it so levels from an earlier run, or an earlier seed in the same range, are replaced.
     DELETE FROM public.levels WHERE branch_id = tourist_branch_id AND order_index > 10 AND order_index <= 20;
 
 
@@ -1,102 +1,92 @@
 BEGIN;
-UPDATE public.levels SET title = 'Take Off Your Shoes', description = 'Shoes off by the door' WHERE id = '06a0cc91-9170-4d2b-b971-5f3a42997b68';
-UPDATE public.levels SET title = 'Indoor Slippers', description = 'Wear slippers inside' WHERE id = '85bb7a03-72a4-4ed3-b820-f4c476dc1bc4';
-UPDATE public.levels SET title = 'Before We Eat: Itadakimasu', description = 'Say Itadakimasu' WHERE id = 'db8c5d08-7759-41d9-a497-672a51fcfe81';
-UPDATE public.levels SET title = 'Thank You: Arigatou', description = 'Say Arigatou' WHERE id = 'cb29f093-1acf-400c-a07a-6d52d0386af2';
-UPDATE public.levels SET title = 'Quiet on the Train', description = 'Talk softly on trains' WHERE id = 'e821aea3-7877-4eba-9abb-0ce60c0081b2';
-UPDATE public.levels SET title = 'Two Hands for Respect', description = 'Giving and receiving with two hands' WHERE id = '09f4f9f2-794c-40aa-b046-68fb51f28c34';
-UPDATE public.levels SET title = 'Wait Your Turn', description = 'Taking turns' WHERE id = '0be66486-c1ad-4b4a-8e5b-4db3a7f01665';
-UPDATE public.levels SET title = 'No Snacks on Trains', description = 'Waiting to eat' WHERE id = '1ad26e56-0cfa-49f6-8c99-38ce0f99d541';
-UPDATE public.levels SET title = 'The Water Station', description = 'Cleaning hands at temples' WHERE id = '28035c22-4ca7-4b90-b595-c58db2011dbf';
-UPDATE public.levels SET title = 'Excuse Me: Sumimasen', description = 'Say Sumimasen' WHERE id = '92869818-c713-4e8c-9a80-bd4d3e33e37b';
-UPDATE public.levels SET title = 'Finished Eating: Gochisousama', description = 'Say Gochisousama' WHERE id = 'ab6e1063-5ac5-4312-8384-af5ae60de2f9';
-UPDATE public.levels SET title = 'Good Morning: Ohayou', description = 'Say Ohayou in the morning' WHERE id = '0aad1988-2a78-40cc-9e0f-fc10a79209a9';
-UPDATE public.levels SET title = 'Good Evening: Konbanwa', description = 'Say Konbanwa at night' WHERE id = 'a5cb8971-bf6e-452b-a501-b3a23a09bd1e';
-UPDATE public.levels SET title = 'I'm Sorry: Gomen Nasai', description = 'Say Gomen Nasai' WHERE id = '91b56893-0f15-46c8-adf3-4ce0e6bff0fc';
-UPDATE public.levels SET title = 'Quiet at the Temple', description = 'Using a quiet voice' WHERE id = 'fffa96e2-6be0-49d8-b01f-08195c7eba23';
-UPDATE public.levels SET title = 'A Polite Bow', description = 'Bowing for respect' WHERE id = 'e0813911-0b66-4453-afea-a34b59dd1932';
-UPDATE public.levels SET title = 'The Green Light', description = 'Waiting for the walk sign' WHERE id = 'b87845fc-7f20-4403-9ca1-cbe0fa6d3df6';
-UPDATE public.levels SET title = 'Trash in the Bin', description = 'Sorting trash' WHERE id = '174dea05-480c-4832-b1f8-8fcf687e0048';
-UPDATE public.levels SET title = 'Stay with the Group', description = 'Group safety' WHERE id = '632a565b-359b-4f59-802d-21639f330185';
-UPDATE public.levels SET title = 'Please: Onegaishimasu', description = 'Saying Onegaishimasu' WHERE id = '1635b324-36b3-41ae-bd7a-1bc73a5886b6';
-UPDATE public.lessons SET title = 'Take Off Your Shoes' WHERE id = 'efccb2f5-d848-484d-acfa-e2cd5567f15a';
-DELETE FROM public.activities WHERE lesson_id = 'efccb2f5-d848-484d-acfa-e2cd5567f15a';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('efccb2f5-d848-484d-acfa-e2cd5567f15a', 'info', 'Take Off Your Shoes', 'Kai went into a house in Japan and saw shoes by the door. In Japan, it is important to take off your outdoor shoes before entering a home!', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('efccb2f5-d848-484d-acfa-e2cd5567f15a', 'multiple_choice', 'What should Kai do next?', '[{"id": "1", "text": "Take off his shoes by the door", "is_correct": true}, {"id": "2", "text": "Put his shoes on the table", "is_correct": false}, {"id": "3", "text": "Wear his shoes inside", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Indoor Slippers' WHERE id = '6f1d036b-32ce-4ab3-a0b1-dd66d4202004';
-DELETE FROM public.activities WHERE lesson_id = '6f1d036b-32ce-4ab3-a0b1-dd66d4202004';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('6f1d036b-32ce-4ab3-a0b1-dd66d4202004', 'info', 'Indoor Slippers', 'Mia saw slippers in a basket near the entrance. These are for guests to wear inside so their feet stay warm and the house stays clean!', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('6f1d036b-32ce-4ab3-a0b1-dd66d4202004', 'multiple_choice', 'Why are slippers there?', '[{"id": "1", "text": "To wear inside the house", "is_correct": true}, {"id": "2", "text": "To wear in the bath", "is_correct": false}, {"id": "3", "text": "To wear outside in the rain", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Before We Eat: Itadakimasu' WHERE id = '40acd529-f220-449a-83df-4c0f3f67c930';
-DELETE FROM public.activities WHERE lesson_id = '40acd529-f220-449a-83df-4c0f3f67c930';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('40acd529-f220-449a-83df-4c0f3f67c930', 'info', 'Before We Eat: Itadakimasu', 'Before eating, Yuki's family says **Itadakimasu** (Ee-tah-dah-KEE-mahs). It means 'I gratefully receive this food.'', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('40acd529-f220-449a-83df-4c0f3f67c930', 'multiple_choice', 'When do people often say Itadakimasu?', '[{"id": "1", "text": "Before eating", "is_correct": true}, {"id": "2", "text": "Before sleeping", "is_correct": false}, {"id": "3", "text": "Before brushing teeth", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Thank You: Arigatou' WHERE id = 'd2379d45-0ffa-452f-aa4e-a9743e6598b3';
-DELETE FROM public.activities WHERE lesson_id = 'd2379d45-0ffa-452f-aa4e-a9743e6598b3';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('d2379d45-0ffa-452f-aa4e-a9743e6598b3', 'info', 'Thank You: Arigatou', 'After dinner, Ben says **Arigatou** (Ah-REE-gah-toh). This is a polite way to say thank you to the chef and the family.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('d2379d45-0ffa-452f-aa4e-a9743e6598b3', 'multiple_choice', 'What does Arigatou mean?', '[{"id": "1", "text": "Thank you", "is_correct": true}, {"id": "2", "text": "Excuse me", "is_correct": false}, {"id": "3", "text": "Goodbye", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Quiet on the Train' WHERE id = '4036170a-3a27-4e12-b3cb-ac7150caa084';
-DELETE FROM public.activities WHERE lesson_id = '4036170a-3a27-4e12-b3cb-ac7150caa084';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('4036170a-3a27-4e12-b3cb-ac7150caa084', 'info', 'Quiet on the Train', 'On a train, Hana noticed most people were quiet. Trains in Japan are quiet places so everyone can relax or read peacefully.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('4036170a-3a27-4e12-b3cb-ac7150caa084', 'multiple_choice', 'What is a good choice on many trains in Japan?', '[{"id": "1", "text": "Talk softly", "is_correct": true}, {"id": "2", "text": "Play music out loud", "is_correct": false}, {"id": "3", "text": "Run in the aisle", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Two Hands for Respect' WHERE id = 'fcdcde3e-71c8-4006-ac2c-db8abbfa0c9d';
-DELETE FROM public.activities WHERE lesson_id = 'fcdcde3e-71c8-4006-ac2c-db8abbfa0c9d';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('fcdcde3e-71c8-4006-ac2c-db8abbfa0c9d', 'info', 'Two Hands for Respect', 'At a store, Sora handed money with two hands. Using both hands shows that you are giving something with care and respect.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('fcdcde3e-71c8-4006-ac2c-db8abbfa0c9d', 'multiple_choice', 'What does using two hands often show?', '[{"id": "1", "text": "Respect", "is_correct": true}, {"id": "2", "text": "Boredom", "is_correct": false}, {"id": "3", "text": "Anger", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Wait Your Turn' WHERE id = '04fc4590-eef7-4a1e-ab0c-02fdc902652c';
-DELETE FROM public.activities WHERE lesson_id = '04fc4590-eef7-4a1e-ab0c-02fdc902652c';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('04fc4590-eef7-4a1e-ab0c-02fdc902652c', 'info', 'Wait Your Turn', 'In a classroom, Aki took turns speaking. In Japan, waiting for your turn is a great way to show you are a good friend and listener.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('04fc4590-eef7-4a1e-ab0c-02fdc902652c', 'multiple_choice', 'What is a good group rule?', '[{"id": "1", "text": "Wait your turn", "is_correct": true}, {"id": "2", "text": "Grab the mic", "is_correct": false}, {"id": "3", "text": "Shout answers", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'No Snacks on Trains' WHERE id = '5dc97608-c2d0-4201-91af-114863a5cdc6';
-DELETE FROM public.activities WHERE lesson_id = '5dc97608-c2d0-4201-91af-114863a5cdc6';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('5dc97608-c2d0-4201-91af-114863a5cdc6', 'info', 'No Snacks on Trains', 'Rin saw a sign that said 'No eating' on the train. Most people wait until they are off the train or at a station to eat their snacks.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('5dc97608-c2d0-4201-91af-114863a5cdc6', 'multiple_choice', 'What should Rin do?', '[{"id": "1", "text": "Wait to eat later", "is_correct": true}, {"id": "2", "text": "Eat a big meal now", "is_correct": false}, {"id": "3", "text": "Drop crumbs on the floor", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'The Water Station' WHERE id = '163db244-453b-41bb-8e96-493ce6e70130';
-DELETE FROM public.activities WHERE lesson_id = '163db244-453b-41bb-8e96-493ce6e70130';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('163db244-453b-41bb-8e96-493ce6e70130', 'info', 'The Water Station', 'At a shrine, Ken washed his hands at a water station called a Temizuya. This is to be clean and prepared before entering.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('163db244-453b-41bb-8e96-493ce6e70130', 'multiple_choice', 'Why do people wash hands at shrines?', '[{"id": "1", "text": "To be clean and respectful", "is_correct": true}, {"id": "2", "text": "To cool off a phone", "is_correct": false}, {"id": "3", "text": "To dry their shoes", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Excuse Me: Sumimasen' WHERE id = '978056b3-942a-405d-8da1-73a320369815';
-DELETE FROM public.activities WHERE lesson_id = '978056b3-942a-405d-8da1-73a320369815';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('978056b3-942a-405d-8da1-73a320369815', 'info', 'Excuse Me: Sumimasen', 'At a restaurant, Emi says **Sumimasen** (Sue-mee-MAH-sen) to get a waiter's attention. It means 'Excuse me.'', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('978056b3-942a-405d-8da1-73a320369815', 'multiple_choice', 'Why might Emi say Sumimasen?', '[{"id": "1", "text": "To get attention politely", "is_correct": true}, {"id": "2", "text": "To say 'Happy birthday'", "is_correct": false}, {"id": "3", "text": "To say 'I am sleepy'", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Finished Eating: Gochisousama' WHERE id = '678e991f-261c-4995-89f4-11bfb4c45958';
-DELETE FROM public.activities WHERE lesson_id = '678e991f-261c-4995-89f4-11bfb4c45958';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('678e991f-261c-4995-89f4-11bfb4c45958', 'info', 'Finished Eating: Gochisousama', 'After eating, Taro says **Gochisousama** (Go-chee-SOH-sah-mah). It means 'Thank you for the feast!'', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('678e991f-261c-4995-89f4-11bfb4c45958', 'multiple_choice', 'When do people often say Gochisousama?', '[{"id": "1", "text": "After eating", "is_correct": true}, {"id": "2", "text": "Before eating", "is_correct": false}, {"id": "3", "text": "Before a test", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Good Morning: Ohayou' WHERE id = '1defa1cd-8e5e-4729-9a00-a3b63e37d9bd';
-DELETE FROM public.activities WHERE lesson_id = '1defa1cd-8e5e-4729-9a00-a3b63e37d9bd';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('1defa1cd-8e5e-4729-9a00-a3b63e37d9bd', 'info', 'Good Morning: Ohayou', 'In the morning, Aya says **Ohayou** (Oh-HAH-yoh). It's a sunshine-filled way to start the day with family and friends!', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('1defa1cd-8e5e-4729-9a00-a3b63e37d9bd', 'multiple_choice', 'When do people often say Ohayou?', '[{"id": "1", "text": "In the morning", "is_correct": true}, {"id": "2", "text": "At night", "is_correct": false}, {"id": "3", "text": "At a wedding", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Good Evening: Konbanwa' WHERE id = '13e3b39e-f16b-4d59-a1db-08da61a836b8';
-DELETE FROM public.activities WHERE lesson_id = '13e3b39e-f16b-4d59-a1db-08da61a836b8';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('13e3b39e-f16b-4d59-a1db-08da61a836b8', 'info', 'Good Evening: Konbanwa', 'When the sun goes down and the moon comes out, Koji says **Konbanwa** (Kon-bahn-wah). It means 'Good evening.'', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('13e3b39e-f16b-4d59-a1db-08da61a836b8', 'multiple_choice', 'What does Konbanwa mean?', '[{"id": "1", "text": "Good evening", "is_correct": true}, {"id": "2", "text": "Good morning", "is_correct": false}, {"id": "3", "text": "Goodbye", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'I'm Sorry: Gomen Nasai' WHERE id = '6370abf1-0a55-411b-af28-0bd29cbe0a97';
-DELETE FROM public.activities WHERE lesson_id = '6370abf1-0a55-411b-af28-0bd29cbe0a97';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('6370abf1-0a55-411b-af28-0bd29cbe0a97', 'info', 'I'm Sorry: Gomen Nasai', 'Nina accidentally bumped into someone and said **Gomen nasai** (Go-men nah-SAI). It's a polite way to say 'I'm sorry.'', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('6370abf1-0a55-411b-af28-0bd29cbe0a97', 'multiple_choice', 'What does Gomen nasai mean?', '[{"id": "1", "text": "I'm sorry", "is_correct": true}, {"id": "2", "text": "Thank you", "is_correct": false}, {"id": "3", "text": "Hello", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Quiet at the Temple' WHERE id = 'c2cda5ea-37f6-42b7-beec-401adef9cafd';
-DELETE FROM public.activities WHERE lesson_id = 'c2cda5ea-37f6-42b7-beec-401adef9cafd';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('c2cda5ea-37f6-42b7-beec-401adef9cafd', 'info', 'Quiet at the Temple', 'A sign at the temple says 'Quiet please.' Temples are peaceful places for people to think and be calm.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('c2cda5ea-37f6-42b7-beec-401adef9cafd', 'multiple_choice', 'What should you do there?', '[{"id": "1", "text": "Use a quiet voice", "is_correct": true}, {"id": "2", "text": "Play a loud game", "is_correct": false}, {"id": "3", "text": "Yell and clap loudly", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'A Polite Bow' WHERE id = 'e47ccdc7-59d8-49c7-b108-96e9aae6b9f2';
-DELETE FROM public.activities WHERE lesson_id = 'e47ccdc7-59d8-49c7-b108-96e9aae6b9f2';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('e47ccdc7-59d8-49c7-b108-96e9aae6b9f2', 'info', 'A Polite Bow', 'In Japan, Leo saw people bow a little when greeting. A small bow (Ojigi) shows that you are happy to see someone and respect them.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('e47ccdc7-59d8-49c7-b108-96e9aae6b9f2', 'multiple_choice', 'What can a small bow show?', '[{"id": "1", "text": "Respect", "is_correct": true}, {"id": "2", "text": "Sleepiness", "is_correct": false}, {"id": "3", "text": "Hunger", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'The Green Light' WHERE id = '75cb24f3-750a-450d-82d2-1973dc2297ff';
-DELETE FROM public.activities WHERE lesson_id = '75cb24f3-750a-450d-82d2-1973dc2297ff';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('75cb24f3-750a-450d-82d2-1973dc2297ff', 'info', 'The Green Light', 'At a crosswalk, Mika waited even though no cars were coming. Waiting for the light is a safe and polite way to follow rules in Japan.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('75cb24f3-750a-450d-82d2-1973dc2297ff', 'multiple_choice', 'What is Mika doing?', '[{"id": "1", "text": "Following the rules", "is_correct": true}, {"id": "2", "text": "Trying to race", "is_correct": false}, {"id": "3", "text": "Playing tag", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Trash in the Bin' WHERE id = '941919a8-c183-457a-83cb-a94c4884eeea';
-DELETE FROM public.activities WHERE lesson_id = '941919a8-c183-457a-83cb-a94c4884eeea';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('941919a8-c183-457a-83cb-a94c4884eeea', 'info', 'Trash in the Bin', 'At a park, Haru put his trash in the right bin. In Japan, everyone helps keep public places clean by sorting their recycling.', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('941919a8-c183-457a-83cb-a94c4884eeea', 'multiple_choice', 'Why sort trash?', '[{"id": "1", "text": "To keep places clean", "is_correct": true}, {"id": "2", "text": "To make more noise", "is_correct": false}, {"id": "3", "text": "To hide toys", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Stay with the Group' WHERE id = 'e02ef94e-6308-4542-972a-d8c43690c25a';
-DELETE FROM public.activities WHERE lesson_id = 'e02ef94e-6308-4542-972a-d8c43690c25a';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('e02ef94e-6308-4542-972a-d8c43690c25a', 'info', 'Stay with the Group', 'On a school trip, Mei stayed close to her group. Staying together makes sure everyone is safe and no one gets lost!', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('e02ef94e-6308-4542-972a-d8c43690c25a', 'multiple_choice', 'What is a safe choice?', '[{"id": "1", "text": "Stay with your group", "is_correct": true}, {"id": "2", "text": "Run far ahead alone", "is_correct": false}, {"id": "3", "text": "Hide from adults", "is_correct": false}]'::jsonb, 2);
-UPDATE public.lessons SET title = 'Please: Onegaishimasu' WHERE id = '72a6d1c4-abb2-4f8e-b465-3abbadfd682e';
-DELETE FROM public.activities WHERE lesson_id = '72a6d1c4-abb2-4f8e-b465-3abbadfd682e';
-INSERT INTO public.activities (lesson_id, type, question_text, content, order_index) VALUES ('72a6d1c4-abb2-4f8e-b465-3abbadfd682e', 'info', 'Please: Onegaishimasu', 'At a café, a kid says **Onegaishimasu** (Oh-neh-gai-shee-MAH-s) when ordering. It's a special way to say 'Please.'', 1);
-INSERT INTO public.activities (lesson_id, type, question_text, options, order_index) VALUES ('72a6d1c4-abb2-4f8e-b465-3abbadfd682e', 'multiple_choice', 'When might someone say Onegaishimasu?', '[{"id": "1", "text": "When asking politely", "is_correct": true}, {"id": "2", "text": "When telling a joke", "is_correct": false}, {"id": "3", "text": "When saying goodbye", "is_correct": false}]'::jsonb, 2);
+UPDATE public.levels AS t SET title = v.title, description = v.description
+FROM (VALUES
+    ('06a0cc91-9170-4d2b-b971-5f3a42997b68', 'Take Off Your Shoes', 'Shoes off by the door'),
+    ('85bb7a03-72a4-4ed3-b820-f4c476dc1bc4', 'Indoor Slippers', 'Wear slippers inside'),
+    ('db8c5d08-7759-41d9-a497-672a51fcfe81', 'Before We Eat: Itadakimasu', 'Say Itadakimasu'),
+    ('cb29f093-1acf-400c-a07a-6d52d0386af2', 'Thank You: Arigatou', 'Say Arigatou'),
+    ('e821aea3-7877-4eba-9abb-0ce60c0081b2', 'Quiet on the Train', 'Talk softly on trains'),
+    ('09f4f9f2-794c-40aa-b046-68fb51f28c34', 'Two Hands for Respect', 'Giving and receiving with two hands'),
+    ('0be66486-c1ad-4b4a-8e5b-4db3a7f01665', 'Wait Your Turn', 'Taking turns'),
+    ('1ad26e56-0cfa-49f6-8c99-38ce0f99d541', 'No Snacks on Trains', 'Waiting to eat'),
+    ('28035c22-4ca7-4b90-b595-c58db2011dbf', 'The Water Station', 'Cleaning hands at temples'),
+    ('92869818-c713-4e8c-9a80-bd4d3e33e37b', 'Excuse Me: Sumimasen', 'Say Sumimasen'),
+    ('ab6e1063-5ac5-4312-8384-af5ae60de2f9', 'Finished Eating: Gochisousama', 'Say Gochisousama'),
+    ('0aad1988-2a78-40cc-9e0f-fc10a79209a9', 'Good Morning: Ohayou', 'Say Ohayou in the morning'),
+    ('a5cb8971-bf6e-452b-a501-b3a23a09bd1e', 'Good Evening: Konbanwa', 'Say Konbanwa at night'),
+    ('91b56893-0f15-46c8-adf3-4ce0e6bff0fc', 'I''m Sorry: Gomen Nasai', 'Say Gomen Nasai'),
+    ('fffa96e2-6be0-49d8-b01f-08195c7eba23', 'Quiet at the Temple', 'Using a quiet voice'),
+    ('e0813911-0b66-4453-afea-a34b59dd1932', 'A Polite Bow', 'Bowing for respect'),
+    ('b87845fc-7f20-4403-9ca1-cbe0fa6d3df6', 'The Green Light', 'Waiting for the walk sign'),
+    ('174dea05-480c-4832-b1f8-8fcf687e0048', 'Trash in the Bin', 'Sorting trash'),
+    ('632a565b-359b-4f59-802d-21639f330185', 'Stay with the Group', 'Group safety'),
+    ('1635b324-36b3-41ae-bd7a-1bc73a5886b6', 'Please: Onegaishimasu', 'Saying Onegaishimasu')
+) AS v(id, title, description)
+WHERE t.id = v.id::uuid;
+UPDATE public.lessons AS t SET title = v.title
+FROM (VALUES
+    ('efccb2f5-d848-484d-acfa-e2cd5567f15a', 'Take Off Your Shoes'),
+    ('6f1d036b-32ce-4ab3-a0b1-dd66d4202004', 'Indoor Slippers'),
+    ('40acd529-f220-449a-83df-4c0f3f67c930', 'Before We Eat: Itadakimasu'),
+    ('d2379d45-0ffa-452f-aa4e-a9743e6598b3', 'Thank You: Arigatou'),
+    ('4036170a-3a27-4e12-b3cb-ac7150caa084', 'Quiet on the Train'),
+    ('fcdcde3e-71c8-4006-ac2c-db8abbfa0c9d', 'Two Hands for Respect'),
+    ('04fc4590-eef7-4a1e-ab0c-02fdc902652c', 'Wait Your Turn'),
+    ('5dc97608-c2d0-4201-91af-114863a5cdc6', 'No Snacks on Trains'),
+    ('163db244-453b-41bb-8e96-493ce6e70130', 'The Water Station'),
+    ('978056b3-942a-405d-8da1-73a320369815', 'Excuse Me: Sumimasen'),
+    ('678e991f-261c-4995-89f4-11bfb4c45958', 'Finished Eating: Gochisousama'),
+    ('1defa1cd-8e5e-4729-9a00-a3b63e37d9bd', 'Good Morning: Ohayou'),
+    ('13e3b39e-f16b-4d59-a1db-08da61a836b8', 'Good Evening: Konbanwa'),
+    ('6370abf1-0a55-411b-af28-0bd29cbe0a97', 'I''m Sorry: Gomen Nasai'),
+    ('c2cda5ea-37f6-42b7-beec-401adef9cafd', 'Quiet at the Temple'),
+    ('e47ccdc7-59d8-49c7-b108-96e9aae6b9f2', 'A Polite Bow'),
+    ('75cb24f3-750a-450d-82d2-1973dc2297ff', 'The Green Light'),
+    ('941919a8-c183-457a-83cb-a94c4884eeea', 'Trash in the Bin'),
+    ('e02ef94e-6308-4542-972a-d8c43690c25a', 'Stay with the Group'),
+    ('72a6d1c4-abb2-4f8e-b465-3abbadfd682e', 'Please: Onegaishimasu')
+) AS v(id, title)
+WHERE t.id = v.id::uuid;
+DELETE FROM public.activities WHERE lesson_id = ANY(ARRAY['efccb2f5-d848-484d-acfa-e2cd5567f15a', '6f1d036b-32ce-4ab3-a0b1-dd66d4202004', '40acd529-f220-449a-83df-4c0f3f67c930', 'd2379d45-0ffa-452f-aa4e-a9743e6598b3', '4036170a-3a27-4e12-b3cb-ac7150caa084', 'fcdcde3e-71c8-4006-ac2c-db8abbfa0c9d', '04fc4590-eef7-4a1e-ab0c-02fdc902652c', '5dc97608-c2d0-4201-91af-114863a5cdc6', '163db244-453b-41bb-8e96-493ce6e70130', '978056b3-942a-405d-8da1-73a320369815', '678e991f-261c-4995-89f4-11bfb4c45958', '1defa1cd-8e5e-4729-9a00-a3b63e37d9bd', '13e3b39e-f16b-4d59-a1db-08da61a836b8', '6370abf1-0a55-411b-af28-0bd29cbe0a97', 'c2cda5ea-37f6-42b7-beec-401adef9cafd', 'e47ccdc7-59d8-49c7-b108-96e9aae6b9f2', '75cb24f3-750a-450d-82d2-1973dc2297ff', '941919a8-c183-457a-83cb-a94c4884eeea', 'e02ef94e-6308-4542-972a-d8c43690c25a', '72a6d1c4-abb2-4f8e-b465-3abbadfd682e']::uuid[]);
+INSERT INTO public.activities (id, lesson_id, type, question_text, content, options, order_index) VALUES
+('73796e8a-a74c-5cec-8e84-a1e64453bbd7', 'efccb2f5-d848-484d-acfa-e2cd5567f15a', 'info', 'Take Off Your Shoes', 'Kai went into a house in Japan and saw shoes by the door. In Japan, it is important to take off your outdoor shoes before entering a home!', NULL, 1),
+('178d6df0-f4b7-5069-b367-746cd06cefae', 'efccb2f5-d848-484d-acfa-e2cd5567f15a', 'multiple_choice', 'What should Kai do next?', NULL, '[{"id": "1", "text": "Take off his shoes by the door", "is_correct": true}, {"id": "2", "text": "Put his shoes on the table", "is_correct": false}, {"id": "3", "text": "Wear his shoes inside", "is_correct": false}]'::jsonb, 2),
+('7ab0fd27-7e17-50ab-a01c-0347a1092f67', '6f1d036b-32ce-4ab3-a0b1-dd66d4202004', 'info', 'Indoor Slippers', 'Mia saw slippers in a basket near the entrance. These are for guests to wear inside so their feet stay warm and the house stays clean!', NULL, 1),
+('70087b27-166e-5bcf-84da-94f32a3a89ef', '6f1d036b-32ce-4ab3-a0b1-dd66d4202004', 'multiple_choice', 'Why are slippers there?', NULL, '[{"id": "1", "text": "To wear inside the house", "is_correct": true}, {"id": "2", "text": "To wear in the bath", "is_correct": false}, {"id": "3", "text": "To wear outside in the rain", "is_correct": false}]'::jsonb, 2),
+('f09ed861-7a0c-5dfa-a6d9-64774836b41e', '40acd529-f220-449a-83df-4c0f3f67c930', 'info', 'Before We Eat: Itadakimasu', 'Before eating, Yuki''s family says **Itadakimasu** (Ee-tah-dah-KEE-mahs). It means ''I gratefully receive this food.''', NULL, 1),
+('42c79c28-b140-5889-a06d-f1f71e28c0dc', '40acd529-f220-449a-83df-4c0f3f67c930', 'multiple_choice', 'When do people often say Itadakimasu?', NULL, '[{"id": "1", "text": "Before eating", "is_correct": true}, {"id": "2", "text": "Before sleeping", "is_correct": false}, {"id": "3", "text": "Before brushing teeth", "is_correct": false}]'::jsonb, 2),
+('18cd58dd-d288-502b-941f-8ac7acd79533', 'd2379d45-0ffa-452f-aa4e-a9743e6598b3', 'info', 'Thank You: Arigatou', 'After dinner, Ben says **Arigatou** (Ah-REE-gah-toh). This is a polite way to say thank you to the chef and the family.', NULL, 1),
+('b778d6f3-9423-592a-b13e-9de7bb2293fc', 'd2379d45-0ffa-452f-aa4e-a9743e6598b3', 'multiple_choice', 'What does Arigatou mean?', NULL, '[{"id": "1", "text": "Thank you", "is_correct": true}, {"id": "2", "text": "Excuse me", "is_correct": false}, {"id": "3", "text": "Goodbye", "is_correct": false}]'::jsonb, 2),
+('c270c9c9-804e-51cd-8240-8a4024bb387f', '4036170a-3a27-4e12-b3cb-ac7150caa084', 'info', 'Quiet on the Train', 'On a train, Hana noticed most people were quiet. Trains in Japan are quiet places so everyone can relax or read peacefully.', NULL, 1),
+('7dc65a49-a05e-52e2-bce2-a555da5ef926', '4036170a-3a27-4e12-b3cb-ac7150caa084', 'multiple_choice', 'What is a good choice on many trains in Japan?', NULL, '[{"id": "1", "text": "Talk softly", "is_correct": true}, {"id": "2", "text": "Play music out loud", "is_correct": false}, {"id": "3", "text": "Run in the aisle", "is_correct": false}]'::jsonb, 2),
+('dc093cd7-c55d-5968-b86c-9a3b073cb5b9', 'fcdcde3e-71c8-4006-ac2c-db8abbfa0c9d', 'info', 'Two Hands for Respect', 'At a store, Sora handed money with two hands. Using both hands shows that you are giving something with care and respect.', NULL, 1),
+('9f8a6a29-539c-51a2-a94f-43c9f8cf6c7d', 'fcdcde3e-71c8-4006-ac2c-db8abbfa0c9d', 'multiple_choice', 'What does using two hands often show?', NULL, '[{"id": "1", "text": "Respect", "is_correct": true}, {"id": "2", "text": "Boredom", "is_correct": false}, {"id": "3", "text": "Anger", "is_correct": false}]'::jsonb, 2),
+('3c9dead4-66a5-57da-abfb-6aa7a52cf2ea', '04fc4590-eef7-4a1e-ab0c-02fdc902652c', 'info', 'Wait Your Turn', 'In a classroom, Aki took turns speaking. In Japan, waiting for your turn is a great way to show you are a good friend and listener.', NULL, 1),
+('eecabe37-9388-5c9a-a862-5f39c4464cb2', '04fc4590-eef7-4a1e-ab0c-02fdc902652c', 'multiple_choice', 'What is a good group rule?', NULL, '[{"id": "1", "text": "Wait your turn", "is_correct": true}, {"id": "2", "text": "Grab the mic", "is_correct": false}, {"id": "3", "text": "Shout answers", "is_correct": false}]'::jsonb, 2),
+('e2e55f68-5de9-5310-bd61-2b1cbb084756', '5dc97608-c2d0-4201-91af-114863a5cdc6', 'info', 'No Snacks on Trains', 'Rin saw a sign that said ''No eating'' on the train. Most people wait until they are off the train or at a station to eat their snacks.', NULL, 1),
+('b455c7c9-d1d4-585e-b6cd-621efca13235', '5dc97608-c2d0-4201-91af-114863a5cdc6', 'multiple_choice', 'What should Rin do?', NULL, '[{"id": "1", "text": "Wait to eat later", "is_correct": true}, {"id": "2", "text": "Eat a big meal now", "is_correct": false}, {"id": "3", "text": "Drop crumbs on the floor", "is_correct": false}]'::jsonb, 2),
+('fb396478-c6a6-50db-82a4-0e02fe5972aa', '163db244-453b-41bb-8e96-493ce6e70130', 'info', 'The Water Station', 'At a shrine, Ken washed his hands at a water station called a Temizuya. This is to be clean and prepared before entering.', NULL, 1),
+('8b148fb9-0d66-5206-be74-c3b82dd5da65', '163db244-453b-41bb-8e96-493ce6e70130', 'multiple_choice', 'Why do people wash hands at shrines?', NULL, '[{"id": "1", "text": "To be clean and respectful", "is_correct": true}, {"id": "2", "text": "To cool off a phone", "is_correct": false}, {"id": "3", "text": "To dry their shoes", "is_correct": false}]'::jsonb, 2),
+('6ca9783f-6840-58c7-8e2a-7c1451487df9', '978056b3-942a-405d-8da1-73a320369815', 'info', 'Excuse Me: Sumimasen', 'At a restaurant, Emi says **Sumimasen** (Sue-mee-MAH-sen) to get a waiter''s attention. It means ''Excuse me.''', NULL, 1),
+('0217e0b4-81e9-5bab-adf2-6f31dc7dd555', '978056b3-942a-405d-8da1-73a320369815', 'multiple_choice', 'Why might Emi say Sumimasen?', NULL, '[{"id": "1", "text": "To get attention politely", "is_correct": true}, {"id": "2", "text": "To say ''Happy birthday''", "is_correct": false}, {"id": "3", "text": "To say ''I am sleepy''", "is_correct": false}]'::jsonb, 2),
+('f84f811f-8a36-5674-9f3e-84cc9e4bbf79', '678e991f-261c-4995-89f4-11bfb4c45958', 'info', 'Finished Eating: Gochisousama', 'After eating, Taro says **Gochisousama** (Go-chee-SOH-sah-mah). It means ''Thank you for the feast!''', NULL, 1),
+('f09caa06-948a-576a-a9fd-3fa6d0e7c5a8', '678e991f-261c-4995-89f4-11bfb4c45958', 'multiple_choice', 'When do people often say Gochisousama?', NULL, '[{"id": "1", "text": "After eating", "is_correct": true}, {"id": "2", "text": "Before eating", "is_correct": false}, {"id": "3", "text": "Before a test", "is_correct": false}]'::jsonb, 2),
+('0cd39d3a-8a96-50e7-95f9-4da94308d1ee', '1defa1cd-8e5e-4729-9a00-a3b63e37d9bd', 'info', 'Good Morning: Ohayou', 'In the morning, Aya says **Ohayou** (Oh-HAH-yoh). It''s a sunshine-filled way to start the day with family and friends!', NULL, 1),
+('d3d0b278-32d0-599c-8cae-d131a4d3eecc', '1defa1cd-8e5e-4729-9a00-a3b63e37d9bd', 'multiple_choice', 'When do people often say Ohayou?', NULL, '[{"id": "1", "text": "In the morning", "is_correct": true}, {"id": "2", "text": "At night", "is_correct": false}, {"id": "3", "text": "At a wedding", "is_correct": false}]'::jsonb, 2),
+('10f9aa15-102f-50b5-9dd0-451eefa3d009', '13e3b39e-f16b-4d59-a1db-08da61a836b8', 'info', 'Good Evening: Konbanwa', 'When the sun goes down and the moon comes out, Koji says **Konbanwa** (Kon-bahn-wah). It means ''Good evening.''', NULL, 1),
+('969bac97-dc61-5c65-9ae3-2f06b0aad373', '13e3b39e-f16b-4d59-a1db-08da61a836b8', 'multiple_choice', 'What does Konbanwa mean?', NULL, '[{"id": "1", "text": "Good evening", "is_correct": true}, {"id": "2", "text": "Good morning", "is_correct": false}, {"id": "3", "text": "Goodbye", "is_correct": false}]'::jsonb, 2),
+('ffb9b2b7-3e5f-51ce-bfb8-3c37c036520c', '6370abf1-0a55-411b-af28-0bd29cbe0a97', 'info', 'I''m Sorry: Gomen Nasai', 'Nina accidentally bumped into someone and said **Gomen nasai** (Go-men nah-SAI). It''s a polite way to say ''I''m sorry.''', NULL, 1),
+('a3880bf8-8b96-5f73-8203-bfb1634c266c', '6370abf1-0a55-411b-af28-0bd29cbe0a97', 'multiple_choice', 'What does Gomen nasai mean?', NULL, '[{"id": "1", "text": "I''m sorry", "is_correct": true}, {"id": "2", "text": "Thank you", "is_correct": false}, {"id": "3", "text": "Hello", "is_correct": false}]'::jsonb, 2),
+('81cf29da-c5fd-5b24-86ee-f3a618ec0598', 'c2cda5ea-37f6-42b7-beec-401adef9cafd', 'info', 'Quiet at the Temple', 'A sign at the temple says ''Quiet please.'' Temples are peaceful places for people to think and be calm.', NULL, 1),
+('88328c53-5bcd-55e4-84ab-b03f428716e3', 'c2cda5ea-37f6-42b7-beec-401adef9cafd', 'multiple_choice', 'What should you do there?', NULL, '[{"id": "1", "text": "Use a quiet voice", "is_correct": true}, {"id": "2", "text": "Play a loud game", "is_correct": false}, {"id": "3", "text": "Yell and clap loudly", "is_correct": false}]'::jsonb, 2),
+('2dd4fe5e-e224-5bd6-a822-1e5e8e174020', 'e47ccdc7-59d8-49c7-b108-96e9aae6b9f2', 'info', 'A Polite Bow', 'In Japan, Leo saw people bow a little when greeting. A small bow (Ojigi) shows that you are happy to see someone and respect them.', NULL, 1),
+('6e19cf75-01f1-523b-b848-bf7fe11aef50', 'e47ccdc7-59d8-49c7-b108-96e9aae6b9f2', 'multiple_choice', 'What can a small bow show?', NULL, '[{"id": "1", "text": "Respect", "is_correct": true}, {"id": "2", "text": "Sleepiness", "is_correct": false}, {"id": "3", "text": "Hunger", "is_correct": false}]'::jsonb, 2),
+('ca94725e-6ce1-5227-91b9-481f7a890514', '75cb24f3-750a-450d-82d2-1973dc2297ff', 'info', 'The Green Light', 'At a crosswalk, Mika waited even though no cars were coming. Waiting for the light is a safe and polite way to follow rules in Japan.', NULL, 1),
+('328c114c-a194-5aa9-aa14-9a607eab1611', '75cb24f3-750a-450d-82d2-1973dc2297ff', 'multiple_choice', 'What is Mika doing?', NULL, '[{"id": "1", "text": "Following the rules", "is_correct": true}, {"id": "2", "text": "Trying to race", "is_correct": false}, {"id": "3", "text": "Playing tag", "is_correct": false}]'::jsonb, 2),
+('4f2951f3-f371-53f2-ae44-861f01ec631f', '941919a8-c183-457a-83cb-a94c4884eeea', 'info', 'Trash in the Bin', 'At a park, Haru put his trash in the right bin. In Japan, everyone helps keep public places clean by sorting their recycling.', NULL, 1),
+('c2c20e61-f65f-5e49-b4ee-5d0ecac9e36d', '941919a8-c183-457a-83cb-a94c4884eeea', 'multiple_choice', 'Why sort trash?', NULL, '[{"id": "1", "text": "To keep places clean", "is_correct": true}, {"id": "2", "text": "To make more noise", "is_correct": false}, {"id": "3", "text": "To hide toys", "is_correct": false}]'::jsonb, 2),
+('37b79c5d-82e5-5cc7-9298-00d7afc7c14b', 'e02ef94e-6308-4542-972a-d8c43690c25a', 'info', 'Stay with the Group', 'On a school trip, Mei stayed close to her group. Staying together makes sure everyone is safe and no one gets lost!', NULL, 1),
+('998b3024-03c8-51ab-9525-792992d8cc98', 'e02ef94e-6308-4542-972a-d8c43690c25a', 'multiple_choice', 'What is a safe choice?', NULL, '[{"id": "1", "text": "Stay with your group", "is_correct": true}, {"id": "2", "text": "Run far ahead alone", "is_correct": false}, {"id": "3", "text": "Hide from adults", "is_correct": false}]'::jsonb, 2),
+('a2de664e-68a2-5006-bc8e-c407ebc04694', '72a6d1c4-abb2-4f8e-b465-3abbadfd682e', 'info', 'Please: Onegaishimasu', 'At a café, a kid says **Onegaishimasu** (Oh-neh-gai-shee-MAH-s) when ordering. It''s a special way to say ''Please.''', NULL, 1),
+('93c32b25-f40e-5df8-aa3d-d426c9a76f74', '72a6d1c4-abb2-4f8e-b465-3abbadfd682e', 'multiple_choice', 'When might someone say Onegaishimasu?', NULL, '[{"id": "1", "text": "When asking politely", "is_correct": true}, {"id": "2", "text": "When telling a joke", "is_correct": false}, {"id": "3", "text": "When saying goodbye", "is_correct": false}]'::jsonb, 2);
 COMMIT;
\ No newline at end of file